@@ -3,23 +3,35 @@
 BioMedical Hub - Application Flask Refactorisée
 Application Flask simplifiée utilisant le gestionnaire WebSocket modulaire
 Version corrigée pour multiprocessing sur Windows
+
+Serveur: SOCKETIO_ASYNC_MODE=threading (défaut, serveur Werkzeug) ou
+eventlet/gevent en production (paquet correspondant à installer):
+    SOCKETIO_ASYNC_MODE=eventlet FLASK_DEBUG=false python app.py
 """
+import os
+
+# Mode asynchrone de Flask-SocketIO; le monkey-patching doit précéder tout autre import
+ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+if ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
 import asyncio
+import functools
+import importlib
 import multiprocessing as mp
-from flask import Flask, render_template, jsonify, request
-from datetime import datetime
+from flask import Flask, render_template, jsonify, request, g
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.serving import WSGIRequestHandler
 import logging
-import os
-import webbrowser
+import socket
 import threading
-import time
-import platform
-import subprocess
-import signal
-
-# Configuration multiprocessing pour Windows - DOIT être au tout début
-if __name__ == '__main__':
-    mp.set_start_method('spawn', force=True)
+import webbrowser
+import orjson
+import psutil
 
 # Configuration du logging
 logging.basicConfig(
@@ -30,13 +42,53 @@ logger = logging.getLogger(__name__)
 
 # Import du gestionnaire WebSocket et du registre des modules
 from websocket_manager import websocket_manager
-from module_registry import ModuleRegistry
+from module_registry import ModuleRegistry, dumps_registry
+from timestamps import now_iso
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Fournisseur JSON Flask utilisant orjson pour jsonify() et request.get_json()
+
+    Scalaires et tableaux numpy sérialisés nativement; les dates passent par
+    DefaultJSONProvider.default (format HTTP de Flask, comme avant orjson).
+    Les données du registre des modules (horodatages ISO) ne passent pas par
+    jsonify() mais par module_registry.dumps_registry.
+    """
+    
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def _encode(self, obj, indent=False):
+        option = self.OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, kwargs.get('indent')).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """jsonify(): corps en bytes directement, sans passer par une str"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self._encode(obj, indent), mimetype=self.mimetype)
+
 
 # Initialisation de l'application Flask
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'biomedical-hub-secret-key-2025')
 app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
 
+
+@app.before_request
+def _stamp_request():
+    """Horodatage unique partagé par tous les champs 'timestamp' de la requête"""
+    g.ts = now_iso()
+
+
 # Variables globales pour les modules
 thought_capture_module = None
 thermal_module = None
@@ -47,59 +99,71 @@ dashboard_home_module = None  # AJOUT: Variable pour dashboard
 module_registry = None
 
 
+# Chemins des modules du hub, importés à la demande par load_module
+# (jamais au niveau du fichier: les processus spawn n'en paient pas le coût)
+MODULE_PATHS = {
+    'thought_capture': 'modules.thought_capture.thought_capture',
+    'thermal_camera': 'modules.thermal_camera.thermal_camera',
+    'polar': 'modules.polar.polar',
+    'neurosity': 'modules.neurosity.neurosity',
+    'gazepoint': 'modules.gazepoint.gazepoint',
+    'dashboard': 'modules.dashboard.dashboard_home'
+}
+
+
+def load_module(name):
+    """Importer le module Python d'un module du hub (mis en cache par sys.modules)"""
+    return importlib.import_module(MODULE_PATHS[name])
+
+
+def load_optional_module(name):
+    """Comme load_module, mais renvoie None si une dépendance manque
+
+    Seuls les imports réussis sont mis en cache (sys.modules): une dépendance
+    installée après coup est prise en compte au prochain appel.
+    """
+    try:
+        return load_module(name)
+    except ImportError as e:
+        logger.error("Module %s indisponible, paquet manquant: %s (%s)", name, e.name or '?', e)
+        return None
+
+
 def init_modules():
     """Initialise tous les modules - appelé seulement dans le main"""
     global thought_capture_module, thermal_module, polar_module, neurosity_module, gazepoint_module, dashboard_home_module, module_registry
     
     # Initialisation du gestionnaire WebSocket
-    websocket_manager.init_app(app)
+    websocket_manager.init_app(app, async_mode=ASYNC_MODE)
     
     # Initialisation du registre des modules
     module_registry = ModuleRegistry()
     
-    # Import et initialisation des modules
-
-    from modules.thought_capture.thought_capture import (
-        init_module as init_thought_capture,
-        register_websocket_events as register_thought_capture_events
-    )
-    from modules.thermal_camera.thermal_camera import (
-        init_thermal_module,
-        register_thermal_websocket_events
-    )
-    from modules.neurosity.neurosity import (
-        init_neurosity_module,
-        register_neurosity_websocket_events
-    )
-    from modules.polar.polar import (
-        init_polar_module,
-        register_polar_websocket_events
-    )
-    from modules.gazepoint.gazepoint import (
-        init_gazepoint_module,
-        register_gazepoint_websocket_events,
-        register_gazepoint_routes
-    )
-    # AJOUT: Import du module dashboard
-    from modules.dashboard.dashboard_home import (
-        init_dashboard_home_module,
-        register_dashboard_home_websocket_events
-    )
+    # Import (via load_module) et initialisation des modules
+    
+    # Un module dont une dépendance manque est ignoré au lieu de bloquer le démarrage
     
     # Initialisation du module Thought Capture
-    thought_capture_module = init_thought_capture(app)
-    logger.info("Module Thought Capture initialisé")
+    thought_capture = load_optional_module('thought_capture')
+    if thought_capture:
+        thought_capture_module = thought_capture.init_module(app)
+        logger.info("Module Thought Capture initialisé")
     
     # Initialisation du module Caméra Thermique
-    thermal_module = init_thermal_module(app, websocket_manager)
-    logger.info("Module Caméra Thermique initialisé")
+    thermal_camera = load_optional_module('thermal_camera')
+    thermal_module = thermal_camera.init_thermal_module(app, websocket_manager) if thermal_camera else None
+    if thermal_module:
+        logger.info("Module Caméra Thermique initialisé")
     
     # Initialisation du module Polar
-    polar_module = init_polar_module(app, websocket_manager)
-    logger.info("Module Polar initialisé")
+    polar = load_optional_module('polar')
+    polar_module = polar.init_polar_module(app, websocket_manager) if polar else None
+    if polar_module:
+        logger.info("Module Polar initialisé")
     
     # Initialisation du module Neurosity
-    neurosity_module = init_neurosity_module(app, websocket_manager)
+    neurosity = load_optional_module('neurosity')
+    neurosity_module = neurosity.init_neurosity_module(app, websocket_manager) if neurosity else None
     if neurosity_module:
         logger.info("Module Neurosity initialisé")
     else:
@@ -107,19 +171,20 @@ def init_modules():
     
     # Initialisation du module Gazepoint
     try:
-        gazepoint_module = init_gazepoint_module(app, websocket_manager)
+        gazepoint = load_module('gazepoint')
+        gazepoint_module = gazepoint.init_gazepoint_module(app, websocket_manager)
         if gazepoint_module:
             logger.info("Module Gazepoint initialisé")
             # Enregistrer les routes Flask pour Gazepoint
-            register_gazepoint_routes(app)
+            gazepoint.register_gazepoint_routes(app)
         else:
             logger.warning("Module Gazepoint non initialisé")
     except Exception as e:
-        logger.error(f"Erreur lors de l'initialisation du module Gazepoint: {e}")
+        logger.error("Erreur lors de l'initialisation du module Gazepoint: %s", e)
         gazepoint_module = None
     
     # AJOUT: Initialisation du module Dashboard Home
-    dashboard_home_module = init_dashboard_home_module(app, websocket_manager)
+    dashboard_home_module = load_module('dashboard').init_dashboard_home_module(app, websocket_manager)
     
     # MODIFICATION: Passer les références de TOUS les modules au dashboard, incluant thought_capture
     dashboard_home_module.set_module_references(
@@ -140,87 +205,59 @@ def init_modules():
 # FONCTION POUR TUER LE PORT
 # ========================
 
+def _port_owner_pids(port):
+    """PIDs (hors processus courant) ayant une connexion locale sur le port"""
+    own_pid = os.getpid()
+    try:
+        return {
+            conn.pid
+            for conn in psutil.net_connections(kind='inet')
+            if conn.laddr and conn.laddr.port == port and conn.pid and conn.pid != own_pid
+        }
+    except psutil.AccessDenied:
+        # macOS: la table système exige root, on parcourt les processus accessibles
+        pids = set()
+        for process in psutil.process_iter():
+            if process.pid == own_pid:
+                continue
+            try:
+                if any(conn.laddr and conn.laddr.port == port
+                       for conn in process.net_connections(kind='inet')):
+                    pids.add(process.pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return pids
+
+
 def kill_port(port):
     """Tuer le processus qui utilise le port spécifié"""
-    system = platform.system()
-    logger.info(f"Tentative de libération du port {port} sur {system}...")
+    logger.info("Tentative de libération du port %s...", port)
     
     try:
-        if system == "Windows":
-            # Pour Windows
-            cmd = f"netstat -ano | findstr :{port}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if result.stdout:
-                lines = result.stdout.strip().split('\n')
-                pids = set()
-                
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) > 4:
-                        pid = parts[-1]
-                        if pid.isdigit():
-                            pids.add(pid)
-                
-                for pid in pids:
-                    try:
-                        kill_cmd = f"taskkill /F /PID {pid}"
-                        subprocess.run(kill_cmd, shell=True, capture_output=True)
-                        logger.info(f"Processus PID {pid} tué sur le port {port}")
-                    except Exception as e:
-                        logger.warning(f"Impossible de tuer le processus PID {pid}: {e}")
-                
-                if pids:
-                    time.sleep(1)
-                    logger.info(f"Port {port} libéré avec succès")
-                else:
-                    logger.info(f"Aucun processus trouvé sur le port {port}")
-            else:
-                logger.info(f"Le port {port} est déjà libre")
+        pids = _port_owner_pids(port)
         
-        else:  # Linux ou macOS
+        if not pids:
+            logger.info("Le port %s est déjà libre", port)
+            return
+        
+        killed = []
+        for pid in pids:
             try:
-                cmd = f"lsof -ti:{port}"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                
-                if result.stdout:
-                    pids = result.stdout.strip().split('\n')
-                    
-                    for pid in pids:
-                        if pid and pid.isdigit():
-                            try:
-                                os.kill(int(pid), signal.SIGKILL)
-                                logger.info(f"Processus PID {pid} tué sur le port {port}")
-                            except ProcessLookupError:
-                                logger.warning(f"Le processus PID {pid} n'existe plus")
-                            except PermissionError:
-                                logger.warning(f"Permission refusée pour tuer le processus PID {pid}")
-                                try:
-                                    subprocess.run(f"sudo kill -9 {pid}", shell=True)
-                                    logger.info(f"Processus PID {pid} tué avec sudo")
-                                except:
-                                    pass
-                    
-                    time.sleep(1)
-                    logger.info(f"Port {port} libéré avec succès")
-                else:
-                    logger.info(f"Le port {port} est déjà libre")
-            
-            except FileNotFoundError:
-                logger.warning("lsof non trouvé. Essai avec netstat...")
-                try:
-                    cmd = f"netstat -tlnp 2>/dev/null | grep :{port}"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                    
-                    if result.stdout:
-                        logger.warning(
-                            f"Un processus utilise le port {port} mais impossible de le tuer automatiquement")
-                        logger.warning("Essayez de tuer le processus manuellement ou utilisez sudo")
-                except:
-                    pass
+                process = psutil.Process(pid)
+                process.kill()
+                killed.append(process)
+                logger.info("Processus PID %s tué sur le port %s", pid, port)
+            except psutil.NoSuchProcess:
+                logger.warning("Le processus PID %s n'existe plus", pid)
+            except psutil.AccessDenied:
+                logger.warning("Permission refusée pour tuer le processus PID %s", pid)
+        
+        # Attendre la fin effective des processus plutôt qu'un délai fixe
+        psutil.wait_procs(killed, timeout=1)
+        logger.info("Port %s libéré avec succès", port)
     
     except Exception as e:
-        logger.error(f"Erreur lors de la tentative de libération du port {port}: {e}")
+        logger.error("Erreur lors de la tentative de libération du port %s: %s", port, e)
         logger.info("Tentative de démarrage du serveur malgré l'erreur...")
 
 
@@ -232,60 +269,165 @@ def open_browser(port):
     """Ouvrir le navigateur après un court délai"""
     
     def _open():
-        time.sleep(1.5)
+        websocket_manager.socketio.sleep(1.5)
         url = f'http://localhost:{port}/#home'
-        logger.info(f"Ouverture du navigateur: {url}")
+        logger.info("Ouverture du navigateur: %s", url)
         webbrowser.open(url)
     
-    thread = threading.Thread(target=_open)
-    thread.daemon = True
-    thread.start()
+    # Tâche de fond gérée par SocketIO (suit l'async_mode configuré)
+    websocket_manager.socketio.start_background_task(_open)
 
 
 # ========================
 # ROUTES PRINCIPALES
 # ========================
 
+@functools.lru_cache(maxsize=1)
+def _cached_modules(registry_version):
+    """Modules du registre, recopiés seulement quand la version du registre change"""
+    # Copie figée: la vue du registre est vivante et n'est pas sérialisable par orjson
+    return dict(module_registry.get_all_modules())
+
+
 @app.route('/')
 def index():
     """Page principale du dashboard"""
     if module_registry:
-        return render_template('base.html', modules=module_registry.get_all_modules())
+        return render_template('base.html', modules=_cached_modules(module_registry.version))
     else:
         return render_template('base.html', modules={})
 
 
+def _not_modified(etag, last_modified=None):
+    """Réponse 304 pour un client dont la version en cache est à jour"""
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
+
+
+def _is_fresh(etag, last_modified=None):
+    """Vrai si les en-têtes conditionnels de la requête valident la version en cache
+
+    If-None-Match est prioritaire; If-Modified-Since n'est consulté qu'en son absence.
+    Les ETags sont faibles (W/"..."): le corps porte un horodatage propre à chaque
+    requête, seul son contenu est garanti équivalent.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    since = request.if_modified_since
+    return (last_modified is not None and since is not None
+            and last_modified.replace(microsecond=0) <= since)
+
+
+@functools.lru_cache(maxsize=128)
+def _module_not_found_body(module_name):
+    """Corps JSON (bytes) de l'erreur 404 d'un module inconnu"""
+    return orjson.dumps({'error': f'Module "{module_name}" not found'})
+
+
+def _module_not_found(module_name):
+    """Réponse 404 pour un module inconnu, corps pré-sérialisé"""
+    response = app.response_class(_module_not_found_body(module_name), status=404,
+                                  mimetype='application/json')
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
 @app.route('/health')
 def health_check():
-    """Endpoint de vérification de santé"""
+    """Endpoint de vérification de santé (jamais conditionnel ni mis en cache)"""
     modules_count = module_registry.get_modules_count() if module_registry else 0
-    return jsonify({
+    connected_clients, active_modules = websocket_manager.get_status_snapshot()
+    
+    response = jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': g.ts,
         'version': '1.0.0',
         'modules_available': modules_count,
         'websocket': {
-            'connected_clients': websocket_manager.get_connected_clients_count(),
-            'active_modules': websocket_manager.get_active_modules_count()
+            'connected_clients': connected_clients,
+            'active_modules': active_modules
         }
     })
+    # Une sonde doit toujours lire l'état courant, même derrière un proxy
+    response.headers['Cache-Control'] = 'no-store'
+    return response
 
 
 # ========================
 # API ENDPOINTS - MODULES
 # ========================
 
+def _with_timestamp(body, depth=1):
+    """Ajouter l'horodatage de la requête à un objet JSON pré-sérialisé
+
+    depth: nombre d'accolades fermantes à traverser (1 = objet racine)
+    """
+    return body[:-depth] + f',"timestamp":"{g.ts}"'.encode('utf-8') + body[-depth:]
+
+
+# Corps JSON (sans horodatage) mis en cache par version du registre et des abonnements:
+# une activation/désactivation ou un (dés)abonnement change la clé, sans TTL
+@functools.lru_cache(maxsize=64)
+def _module_info_body(module_name, registry_version, clients_version):
+    """Informations d'un module pré-sérialisées, None si le module est inconnu"""
+    module_data = module_registry.get_module(module_name)
+    if not module_data:
+        return None
+    
+    clients_count = websocket_manager.count_module_clients(module_name)
+    
+    # Payload construit par fusion, l'entrée du registre n'est jamais modifiée
+    return dumps_registry({
+        'module': module_name,
+        'data': {
+            **module_data,
+            'websocket': {
+                'connected_clients': clients_count,
+                'is_active': clients_count > 0
+            }
+        }
+    })
+
+
+@functools.lru_cache(maxsize=64)
+def _module_status_body(module_name, registry_version, clients_version):
+    """Statut d'un module pré-sérialisé, None si le module est inconnu"""
+    module_data = module_registry.get_module(module_name)
+    if not module_data:
+        return None
+    
+    connected_clients = websocket_manager.get_module_clients(module_name)
+    
+    return orjson.dumps({
+        'module': module_name,
+        'status': module_data.get('status', 'unknown'),
+        'enabled': module_data.get('enabled', False),
+        'websocket': {
+            'connected_clients': len(connected_clients),
+            'client_ids': connected_clients,
+            'is_active': bool(connected_clients)
+        }
+    })
+
+
 @app.route('/api/modules')
 def get_modules():
     """Récupérer la liste de tous les modules"""
     if not module_registry:
         return jsonify({'error': 'Module registry not initialized'}), 503
     
-    return jsonify({
-        'modules': module_registry.get_all_modules(),
-        'total': module_registry.get_modules_count(),
-        'timestamp': datetime.now().isoformat()
-    })
+    payload, etag = module_registry.get_modules_payload()
+    last_modified = module_registry.modified_at
+    if _is_fresh(etag, last_modified):
+        return _not_modified(etag, last_modified)
+    
+    response = app.response_class(_with_timestamp(payload), mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    return response
 
 
 @app.route('/api/modules/<module_name>')
@@ -294,22 +436,20 @@ def get_module_info(module_name):
     if not module_registry:
         return jsonify({'error': 'Module registry not initialized'}), 503
     
-    module_data = module_registry.get_module(module_name)
+    versions = (module_registry.version, websocket_manager.clients_version)
+    etag = f"module-{module_name}-{versions[0]}-{versions[1]}"
+    if _is_fresh(etag):
+        return _not_modified(etag)
     
-    if not module_data:
-        return jsonify({'error': f'Module "{module_name}" not found'}), 404
+    body = _module_info_body(module_name, *versions)
     
-    module_data = module_data.copy()
-    module_data['websocket'] = {
-        'connected_clients': len(websocket_manager.get_module_clients(module_name)),
-        'is_active': len(websocket_manager.get_module_clients(module_name)) > 0
-    }
-    module_data['timestamp'] = datetime.now().isoformat()
+    if body is None:
+        return _module_not_found(module_name)
     
-    return jsonify({
-        'module': module_name,
-        'data': module_data
-    })
+    # L'horodatage est dans 'data', un niveau sous la racine
+    response = app.response_class(_with_timestamp(body, depth=2), mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app.route('/api/modules/<module_name>/status')
@@ -318,23 +458,19 @@ def get_module_status(module_name):
     if not module_registry:
         return jsonify({'error': 'Module registry not initialized'}), 503
     
-    if not module_registry.module_exists(module_name):
-        return jsonify({'error': f'Module "{module_name}" not found'}), 404
+    versions = (module_registry.version, websocket_manager.clients_version)
+    etag = f"status-{module_name}-{versions[0]}-{versions[1]}"
+    if _is_fresh(etag):
+        return _not_modified(etag)
     
-    module_data = module_registry.get_module(module_name)
-    connected_clients = websocket_manager.get_module_clients(module_name)
+    body = _module_status_body(module_name, *versions)
     
-    return jsonify({
-        'module': module_name,
-        'status': module_data.get('status', 'unknown'),
-        'enabled': module_data.get('enabled', False),
-        'websocket': {
-            'connected_clients': len(connected_clients),
-            'client_ids': connected_clients,
-            'is_active': len(connected_clients) > 0
-        },
-        'timestamp': datetime.now().isoformat()
-    })
+    if body is None:
+        return _module_not_found(module_name)
+    
+    response = app.response_class(_with_timestamp(body), mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app.route('/api/modules/<module_name>/activate', methods=['POST'])
@@ -343,27 +479,23 @@ def activate_module(module_name):
     if not module_registry:
         return jsonify({'error': 'Module registry not initialized'}), 503
     
-    if not module_registry.module_exists(module_name):
-        return jsonify({'error': f'Module "{module_name}" not found'}), 404
+    # activate_module() ne renvoie False que pour un module inconnu
+    if not module_registry.activate_module(module_name):
+        return _module_not_found(module_name)
     
-    success = module_registry.activate_module(module_name)
+    websocket_manager.emit_module_status('module_activated', {
+        'module': module_name,
+        'timestamp': g.ts
+    })
     
-    if success:
-        websocket_manager.broadcast('module_activated', {
-            'module': module_name,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        logger.info(f"Module {module_name} activé")
-        
-        return jsonify({
-            'success': True,
-            'module': module_name,
-            'status': 'activated',
-            'timestamp': datetime.now().isoformat()
-        })
-    else:
-        return jsonify({'error': f'Failed to activate module "{module_name}"'}), 500
+    logger.info("Module %s activé", module_name)
+    
+    return jsonify({
+        'success': True,
+        'module': module_name,
+        'status': 'activated',
+        'timestamp': g.ts
+    })
 
 
 @app.route('/api/modules/<module_name>/deactivate', methods=['POST'])
@@ -372,27 +504,23 @@ def deactivate_module(module_name):
     if not module_registry:
         return jsonify({'error': 'Module registry not initialized'}), 503
     
-    if not module_registry.module_exists(module_name):
-        return jsonify({'error': f'Module "{module_name}" not found'}), 404
+    # deactivate_module() ne renvoie False que pour un module inconnu
+    if not module_registry.deactivate_module(module_name):
+        return _module_not_found(module_name)
     
-    success = module_registry.deactivate_module(module_name)
+    websocket_manager.emit_module_status('module_deactivated', {
+        'module': module_name,
+        'timestamp': g.ts
+    })
     
-    if success:
-        websocket_manager.broadcast('module_deactivated', {
-            'module': module_name,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        logger.info(f"Module {module_name} désactivé")
-        
-        return jsonify({
-            'success': True,
-            'module': module_name,
-            'status': 'deactivated',
-            'timestamp': datetime.now().isoformat()
-        })
-    else:
-        return jsonify({'error': f'Failed to deactivate module "{module_name}"'}), 500
+    logger.info("Module %s désactivé", module_name)
+    
+    return jsonify({
+        'success': True,
+        'module': module_name,
+        'status': 'deactivated',
+        'timestamp': g.ts
+    })
 
 
 # ========================
@@ -402,78 +530,147 @@ def deactivate_module(module_name):
 @app.route('/api/websocket/status')
 def get_websocket_status():
     """Récupérer le statut des WebSockets"""
+    connected_clients, active_modules = websocket_manager.get_status_snapshot()
     return jsonify({
-        'connected_clients': websocket_manager.get_connected_clients_count(),
-        'active_modules': websocket_manager.get_active_modules_count(),
-        'timestamp': datetime.now().isoformat()
+        'connected_clients': connected_clients,
+        'active_modules': active_modules,
+        'timestamp': g.ts
     })
 
 
 @app.route('/api/websocket/clients')
 def get_websocket_clients():
     """Récupérer la liste des clients connectés (informations limitées)"""
-    clients_info = []
-    
-    for client_id, info in websocket_manager.connected_clients.items():
-        clients_info.append({
-            'client_id': client_id[:8] + '...',
-            'connected_at': info.get('connected_at'),
-            'subscriptions': info.get('subscriptions', []),
-            'ip': info.get('ip', 'Unknown')[:10] + '...'
-        })
+    etag = f"clients-{websocket_manager.clients_version}"
+    if _is_fresh(etag):
+        return _not_modified(etag)
     
-    return jsonify({
+    # Liste résumée mise en cache par le gestionnaire, invalidée à chaque connexion/abonnement
+    clients_info = websocket_manager.get_clients_summary()
+    
+    response = jsonify({
         'clients': clients_info,
         'total': len(clients_info),
-        'timestamp': datetime.now().isoformat()
+        'timestamp': g.ts
     })
+    response.set_etag(etag, weak=True)
+    return response
 
 
 # ========================
 # HANDLERS D'ÉVÉNEMENTS WEBSOCKET HOME & DEVICES
 # ========================
 
-def handle_get_devices_status(data):
-    """Gère la demande de statut des appareils"""
-    status = {
-        'polar': {
-            'connected': False,
-            'devices': []
-        },
-        'neurosity': {
-            'connected': False
-        },
-        'thermal': {
-            'connected': False
-        },
-        'gazepoint': {
-            'connected': False
-        },
-        'thought_capture': {  # AJOUT: Statut du module thought_capture
-            'ready': True,
-            'recording': False
-        },
-        'timestamp': datetime.now().isoformat()
+# Table {module: {événement: handler}} remplie à l'import par @websocket_event,
+# enregistrée en une passe par register_module_websocket_events
+WEBSOCKET_EVENTS = {}
+
+
+def websocket_event(module_name, event_name):
+    """Déclarer un handler pour l'événement '<module_name>_<event_name>'"""
+    def decorator(handler):
+        WEBSOCKET_EVENTS.setdefault(module_name, {})[event_name] = handler
+        return handler
+    return decorator
+
+
+# Boucle asyncio de fond partagée, démarrée au premier besoin
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+
+def _run_async(coro, timeout=2.0):
+    """Exécuter une coroutine sur la boucle asyncio de fond et attendre son résultat"""
+    global _async_loop
+    if _async_loop is None:
+        with _async_loop_lock:
+            if _async_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='asyncio-loop', daemon=True).start()
+                _async_loop = loop
+    
+    future = asyncio.run_coroutine_threadsafe(coro, _async_loop)
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        future.cancel()
+        raise
+
+
+async def _gather_with_timeout(coros, timeout=1.0):
+    """Attendre en parallèle des coroutines {nom: coroutine}
+
+    Chacune est bornée par `timeout`; une erreur ou un dépassement est
+    renvoyé comme exception à la place du résultat, sans bloquer les autres.
+    """
+    results = await asyncio.gather(
+        *(asyncio.wait_for(coro, timeout) for coro in coros.values()),
+        return_exceptions=True
+    )
+    return dict(zip(coros, results))
+
+
+# Statut par défaut des appareils, copié (un niveau) à chaque demande
+_DEVICES_STATUS_TEMPLATE = {
+    'polar': {
+        'connected': False,
+        'devices': ()
+    },
+    'neurosity': {
+        'connected': False
+    },
+    'thermal': {
+        'connected': False
+    },
+    'gazepoint': {
+        'connected': False
+    },
+    'thought_capture': {  # AJOUT: Statut du module thought_capture
+        'ready': True,
+        'recording': False
     }
+}
+
+
+# Empreinte du dernier statut des appareils envoyé à chaque client (clé: request.sid)
+_last_status_hash = {}
+
+
+@websocket_manager.on_client_disconnect
+def _forget_status_hash(client_id):
+    """Oublier le dernier statut envoyé à un client déconnecté"""
+    _last_status_hash.pop(client_id, None)
+
+
+@websocket_event('dashboard', 'get_devices_status')  # NOUVEAU
+def handle_get_devices_status(data):
+    """Gère la demande de statut des appareils (rien n'est renvoyé si le statut n'a pas changé)"""
+    status = {device: dict(fields) for device, fields in _DEVICES_STATUS_TEMPLATE.items()}
+    status['polar']['devices'] = []
     
-    # Vérifier le statut Polar
+    # Statuts asynchrones, interrogés en parallèle sur la boucle de fond
+    probes = {}
     if polar_module:
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            polar_status = loop.run_until_complete(polar_module.get_devices_status())
-            
-            # Vérifier que polar_status n'est pas None
-            if polar_status:
-                if polar_status.get('h10', {}).get('connected'):
-                    status['polar']['connected'] = True
-                    status['polar']['devices'].append('h10')
-                
-                if polar_status.get('verity', {}).get('connected'):
-                    status['polar']['connected'] = True
-                    status['polar']['devices'].append('verity')
-        except Exception as e:
-            logger.error(f"Erreur récupération statut Polar: {e}")
+        probes['polar'] = polar_module.get_devices_status()
+    
+    try:
+        results = _run_async(_gather_with_timeout(probes)) if probes else {}
+    except Exception as e:
+        logger.error("Erreur récupération statut des appareils: %s", e)
+        results = {}
+    
+    # Vérifier le statut Polar
+    polar_status = results.get('polar')
+    if isinstance(polar_status, Exception):
+        logger.error("Erreur récupération statut Polar: %r", polar_status)
+    elif polar_status:
+        if polar_status.get('h10', {}).get('connected'):
+            status['polar']['connected'] = True
+            status['polar']['devices'].append('h10')
+        
+        if polar_status.get('verity', {}).get('connected'):
+            status['polar']['connected'] = True
+            status['polar']['devices'].append('verity')
     
     # Vérifier le statut Neurosity
     if neurosity_module and hasattr(neurosity_module, 'crown') and neurosity_module.crown:
@@ -488,39 +685,50 @@ def handle_get_devices_status(data):
         status['thought_capture']['ready'] = True
         # Si on avait accès à l'état d'enregistrement, on le mettrait ici
     
+    # Même statut (hors horodatage) que le dernier envoyé à ce client: pas d'émission
+    status_hash = hash(orjson.dumps(status))
+    if _last_status_hash.get(request.sid) == status_hash:
+        return
+    _last_status_hash[request.sid] = status_hash
+    
+    status['timestamp'] = now_iso()
     websocket_manager.emit_to_current_client('devices_status', status)
 
 
-def handle_dashboard_home_request(data):
-    """Gère les requêtes du dashboard home"""
-    if dashboard_home_module:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        status = loop.run_until_complete(dashboard_home_module.get_aggregated_data())
-        websocket_manager.emit_to_current_client('dashboard_data', status)
-
+def _make_aggregated_data_handler(response_event):
+    """Crée un handler renvoyant les données agrégées du dashboard home sous `response_event`"""
+    
+    def handler(data):
+        if dashboard_home_module:
+            status = _run_async(dashboard_home_module.get_aggregated_data())
+            websocket_manager.emit_to_current_client(response_event, status)
+    
+    return handler
 
-def handle_dashboard_home_status(data):
-    """Envoie le statut du dashboard home"""
-    if dashboard_home_module:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        status = loop.run_until_complete(dashboard_home_module.get_aggregated_data())
-        websocket_manager.emit_to_current_client('dashboard_status', status)
 
+def _make_collection_handler(action, response_event):
+    """Crée un handler appelant `action` (start/stop_collection) sur le dashboard home"""
+    
+    def handler(data):
+        if dashboard_home_module:
+            result = getattr(dashboard_home_module, action)()
+            websocket_manager.emit_to_current_client(response_event, result)
+    
+    return handler
 
-def handle_start_collection(data):
-    """Démarre la collecte globale via dashboard"""
-    if dashboard_home_module:
-        result = dashboard_home_module.start_collection()
-        websocket_manager.emit_to_current_client('collection_started', result)
 
+# MODIFICATION: Événements pour le dashboard principal pointent vers dashboard
+# Requêtes du dashboard home et statut
+handle_dashboard_home_request = websocket_event('dashboard', 'request_dashboard_data')(
+    _make_aggregated_data_handler('dashboard_data'))
+handle_dashboard_home_status = websocket_event('dashboard', 'get_dashboard_status')(
+    _make_aggregated_data_handler('dashboard_status'))
 
-def handle_stop_collection(data):
-    """Arrête la collecte globale via dashboard"""
-    if dashboard_home_module:
-        result = dashboard_home_module.stop_collection()
-        websocket_manager.emit_to_current_client('collection_stopped', result)
+# Démarrage / arrêt de la collecte globale via dashboard
+handle_start_collection = websocket_event('dashboard', 'start_collection')(
+    _make_collection_handler('start_collection', 'collection_started'))
+handle_stop_collection = websocket_event('dashboard', 'stop_collection')(
+    _make_collection_handler('stop_collection', 'collection_stopped'))
 
 
 def handle_dashboard_data_request(data):
@@ -529,23 +737,25 @@ def handle_dashboard_data_request(data):
         handle_dashboard_home_request(data)
     else:
         # Fallback vers l'ancien système
-        modules = module_registry.get_all_modules() if module_registry else {}
+        modules = _cached_modules(module_registry.version) if module_registry else {}
+        connected_clients, active_modules = websocket_manager.get_status_snapshot()
         websocket_manager.emit_to_current_client('dashboard_data', {
             'modules': modules,
             'websocket_status': {
-                'connected_clients': websocket_manager.get_connected_clients_count(),
-                'active_modules': websocket_manager.get_active_modules_count()
+                'connected_clients': connected_clients,
+                'active_modules': active_modules
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         })
 
 
+@websocket_event('dashboard', 'update_dashboard_config')
 def handle_dashboard_config_update(data):
     """Gérer une mise à jour de configuration du dashboard"""
-    logger.info(f"Configuration dashboard mise à jour: {data}")
+    logger.info("Configuration dashboard mise à jour: %s", data)
     websocket_manager.emit_to_current_client('config_updated', {
         'success': True,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': now_iso()
     })
 
 
@@ -555,49 +765,36 @@ def handle_dashboard_config_update(data):
 
 def register_module_websocket_events():
     """Enregistrer les événements WebSocket spécifiques aux modules"""
-    from modules.polar.polar import register_polar_websocket_events
-    from modules.thermal_camera.thermal_camera import register_thermal_websocket_events
-    from modules.neurosity.neurosity import register_neurosity_websocket_events
-    from modules.thought_capture.thought_capture import register_websocket_events as register_thought_capture_events
-    from modules.gazepoint.gazepoint import register_gazepoint_websocket_events
-    
-    # MODIFICATION: Événements pour le dashboard principal pointent vers dashboard
-    dashboard_events = {
-        'request_dashboard_data': handle_dashboard_home_request,
-        'get_dashboard_status': handle_dashboard_home_status,
-        'start_collection': handle_start_collection,
-        'stop_collection': handle_stop_collection,
-        'update_dashboard_config': handle_dashboard_config_update,
-        'get_devices_status': handle_get_devices_status  # NOUVEAU
-    }
-    websocket_manager.register_module_events('dashboard', dashboard_events)
+    # Événements déclarés dans WEBSOCKET_EVENTS (dashboard principal), en une passe
+    websocket_manager.register_modules_bulk(WEBSOCKET_EVENTS)
     
     # Événements pour le module Polar
     if polar_module:
-        register_polar_websocket_events(websocket_manager, polar_module)
+        load_module('polar').register_polar_websocket_events(websocket_manager, polar_module)
     
     # Enregistrer les événements du module thermique
     if thermal_module:
-        register_thermal_websocket_events(websocket_manager, thermal_module)
+        load_module('thermal_camera').register_thermal_websocket_events(websocket_manager, thermal_module)
     
     # Enregistrer les événements du module Neurosity
     if neurosity_module:
-        register_neurosity_websocket_events(websocket_manager, neurosity_module)
+        load_module('neurosity').register_neurosity_websocket_events(websocket_manager, neurosity_module)
     
     # Enregistrer les événements du module Gazepoint
     if gazepoint_module:
-        register_gazepoint_websocket_events(websocket_manager, gazepoint_module)
+        load_module('gazepoint').register_gazepoint_websocket_events(websocket_manager, gazepoint_module)
         logger.info("Événements WebSocket Gazepoint enregistrés avec succès")
     else:
         logger.warning("Module Gazepoint non disponible pour l'enregistrement des événements")
     
     # Enregistrer les événements du module Capture de la Pensée
-    register_thought_capture_events(websocket_manager)
+    thought_capture = load_optional_module('thought_capture')
+    if thought_capture:
+        thought_capture.register_websocket_events(websocket_manager)
     
     # AJOUT: Enregistrer les événements du module Dashboard Home
     if dashboard_home_module:
-        from modules.dashboard.dashboard_home import register_dashboard_home_websocket_events
-        register_dashboard_home_websocket_events(
+        load_module('dashboard').register_dashboard_home_websocket_events(
             websocket_manager,
             dashboard_home_module,
             polar_module=polar_module,
@@ -610,15 +807,20 @@ def register_module_websocket_events():
 # GESTION D'ERREURS
 # ========================
 
+# Corps d'erreur sérialisés une fois; une Response neuve par requête (objet mutable)
+_NOT_FOUND_BODY = orjson.dumps({'error': 'Page not found'})
+_INTERNAL_ERROR_BODY = orjson.dumps({'error': 'Internal server error'})
+
+
 @app.errorhandler(404)
 def not_found_error(error):
-    return jsonify({'error': 'Page not found'}), 404
+    return app.response_class(_NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 
 @app.errorhandler(500)
 def internal_error(error):
-    logger.error(f"Erreur interne du serveur: {error}")
-    return jsonify({'error': 'Internal server error'}), 500
+    logger.error("Erreur interne du serveur: %s", error)
+    return app.response_class(_INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
 
 
 # ========================
@@ -636,60 +838,69 @@ def cleanup_modules():
                 dashboard_home_module.stop_collection()
             logger.info("Module Dashboard Home nettoyé")
         except Exception as e:
-            logger.error(f"Erreur nettoyage module Dashboard Home: {e}")
+            logger.error("Erreur nettoyage module Dashboard Home: %s", e)
     
-    # Nettoyer le module Neurosity
+    # Les modules d'appareils sont indépendants: nettoyage en parallèle sur la
+    # boucle de fond (méthodes synchrones déportées dans des threads)
+    cleanups = {}
     if neurosity_module:
-        try:
-            neurosity_module.cleanup()
-            logger.info("Module Neurosity nettoyé")
-        except Exception as e:
-            logger.error(f"Erreur nettoyage module Neurosity: {e}")
-    
-    # Nettoyer le module Polar
+        cleanups['Neurosity'] = asyncio.to_thread(neurosity_module.cleanup)
     if polar_module:
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(polar_module.cleanup())
-            logger.info("Module Polar nettoyé")
-        except Exception as e:
-            logger.error(f"Erreur nettoyage module Polar: {e}")
-    
-    # Nettoyer le module Gazepoint
+        cleanups['Polar'] = polar_module.cleanup()
     if gazepoint_module:
-        try:
-            gazepoint_module.cleanup()
-            logger.info("Module Gazepoint nettoyé")
-        except Exception as e:
-            logger.error(f"Erreur nettoyage module Gazepoint: {e}")
-    
-    # Nettoyer le module Thermal
+        cleanups['Gazepoint'] = asyncio.to_thread(gazepoint_module.cleanup)
     if thermal_module:
-        try:
-            thermal_module.stop_capture()
-            logger.info("Module Thermal nettoyé")
-        except Exception as e:
-            logger.error(f"Erreur nettoyage module Thermal: {e}")
+        cleanups['Thermal'] = asyncio.to_thread(thermal_module.stop_capture)
+    # Si le module Thought Capture a une méthode cleanup, l'appeler
+    if thought_capture_module and hasattr(thought_capture_module, 'cleanup'):
+        cleanups['Thought Capture'] = asyncio.to_thread(thought_capture_module.cleanup)
     
-    # Nettoyer le module Thought Capture
-    if thought_capture_module:
+    if cleanups:
         try:
-            # Si le module a une méthode cleanup, l'appeler
-            if hasattr(thought_capture_module, 'cleanup'):
-                thought_capture_module.cleanup()
-            logger.info("Module Thought Capture nettoyé")
+            results = _run_async(_gather_with_timeout(cleanups, timeout=5.0), timeout=10.0)
         except Exception as e:
-            logger.error(f"Erreur nettoyage module Thought Capture: {e}")
+            logger.error("Erreur nettoyage des modules: %s", e)
+            results = {}
+        
+        for name, result in results.items():
+            if isinstance(result, BaseException):
+                logger.error("Erreur nettoyage module %s: %r", name, result)
+            else:
+                logger.info("Module %s nettoyé", name)
     
     logger.info("Nettoyage terminé")
 
 
+# ========================
+# SERVEUR WERKZEUG (MODE THREADING)
+# ========================
+
+class LowLatencyRequestHandler(WSGIRequestHandler):
+    """Connexions sans algorithme de Nagle (TCP_NODELAY) et avec un tampon d'envoi agrandi
+
+    Les petits messages WebSocket (statuts, échantillons) partent immédiatement
+    au lieu d'attendre d'être regroupés par le noyau.
+    """
+    disable_nagle_algorithm = True
+    send_buffer_size = 1 << 20
+    
+    def setup(self):
+        super().setup()
+        try:
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        except OSError:
+            pass
+
+
 # ========================
 # POINT D'ENTRÉE PRINCIPAL
 # ========================
 
-if __name__ == '__main__':
+def main():
+    """Démarrer le hub (appelé par `python app.py` ou relancé par dev.py)"""
+    # Configuration multiprocessing pour Windows - avant tout processus enfant
+    mp.set_start_method('spawn', force=True)
+    
     # Configuration du serveur
     host = 'localhost'
     port = int(os.environ.get('PORT', 3333))
@@ -706,8 +917,9 @@ if __name__ == '__main__':
     logger.info("=" * 60)
     logger.info("DÉMARRAGE DU BIOMEDICAL HUB")
     logger.info("=" * 60)
-    logger.info(f"Serveur: http://localhost:{port}")
-    logger.info(f"Mode debug: {debug}")
+    logger.info("Serveur: http://localhost:%s", port)
+    logger.info("Mode debug: %s", debug)
+    logger.info("Mode SocketIO: %s", ASYNC_MODE)
     logger.info("=" * 60)
     
     # Initialiser les modules SEULEMENT dans le processus principal
@@ -715,8 +927,12 @@ if __name__ == '__main__':
     
     # Ouvrir automatiquement le navigateur
     if not os.environ.get('NO_BROWSER', False):
-        if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
-            open_browser(port)
+        open_browser(port)
+    
+    # Options propres au serveur Werkzeug (les serveurs eventlet/gevent ne les acceptent pas)
+    server_options = {}
+    if ASYNC_MODE == 'threading':
+        server_options['request_handler'] = LowLatencyRequestHandler
     
     try:
         # Démarrage du serveur
@@ -726,14 +942,19 @@ if __name__ == '__main__':
             port=port,
             debug=debug,
             allow_unsafe_werkzeug=True,
-            use_reloader=debug
+            use_reloader=False,  # Rechargement à chaud: voir dev.py
+            **server_options
         )
     except KeyboardInterrupt:
         logger.info("\nArrêt demandé par l'utilisateur...")
         cleanup_modules()
     except Exception as e:
-        logger.error(f"Erreur lors du démarrage: {e}")
+        logger.error("Erreur lors du démarrage: %s", e)
         cleanup_modules()
         raise
     finally:
-        logger.info("Application fermée")
\ No newline at end of file
+        logger.info("Application fermée")
+
+
+if __name__ == '__main__':
+    main()
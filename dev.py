@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+BioMedical Hub - Lancement en développement
+Relance complète de app.main() à chaque modification d'un fichier Python,
+détectée par watchfiles au lieu du rechargeur Werkzeug
+
+    pip install -r requirements-dev.txt
+    python dev.py
+"""
+import os
+import sys
+
+try:
+    from watchfiles import PythonFilter, run_process
+except ImportError:
+    sys.exit("dev.py nécessite watchfiles: pip install -r requirements-dev.txt")
+
+if __name__ == '__main__':
+    # Pas de nouvel onglet du navigateur à chaque relance
+    os.environ.setdefault('NO_BROWSER', '1')
+    os.environ.setdefault('FLASK_DEBUG', 'True')
+    run_process('.', target='app.main', watch_filter=PythonFilter())
@@ -4,217 +4,353 @@ Module Registry - BioMedical Hub
 Registre centralisé pour la gestion des modules
 """
 
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
+import hashlib
 import logging
+import sys
+from types import MappingProxyType
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+# Champs obligatoires de la configuration d'un module
+_REQUIRED_FIELDS = frozenset({'name', 'description', 'icon'})
+
+# Champs optionnels qui doivent être des listes
+_LIST_FIELDS = ('features', 'dependencies')
+
+# Champs à faible cardinalité, internés pour les configurations reçues de l'extérieur
+_INTERNED_FIELDS = ('category', 'status')
+
+
+def _intern_fields(module_config):
+    """Interner les valeurs de catégorie/statut (les littéraux du code le sont déjà)"""
+    for field in _INTERNED_FIELDS:
+        value = module_config.get(field)
+        if type(value) is str:
+            module_config[field] = sys.intern(value)
+
+
+# Horodatages des modules (created_at, updated_at, activated_at, deactivated_at):
+# objets datetime, mis en forme ISO seulement à la sérialisation par dumps_registry
+# (orjson les écrit comme isoformat())
+
+
+def dumps_registry(obj):
+    """Sérialiser en JSON (bytes) des données du registre, horodatages en ISO 8601
+
+    Point de sérialisation unique des données du registre: jsonify() écrirait
+    les datetime au format HTTP de Flask (voir OrjsonProvider dans app.py).
+    """
+    return orjson.dumps(obj)
+
+# Horodatage de création des modules par défaut, pris une seule fois à l'import
+_BOOT_TS = datetime.now()
+
+# Modules par défaut, construits une seule fois; chaque registre en fait une copie
+_DEFAULT_MODULES = {
+    'dashboard': {
+        'name': 'Base Principal',
+        'description': 'Centre de contrôle principal',
+        'icon': 'fas fa-dashboard',
+        'enabled': True,
+        'status': 'active',
+        'version': '1.0.0',
+        'category': 'core',
+        'dependencies': [],
+        'config': {},
+        'created_at': _BOOT_TS
+    },
+    'polar': {
+        'name': 'Polar Monitor',
+        'subtitle': 'H10 / Verity Sense',
+        'description': 'Moniteur cardiaque et analyse ECG en temps réel',
+        'icon': 'fas fa-heartbeat',
+        'color': '#ff6b6b',
+        'badge': 'ECG',
+        'enabled': True,
+        'status': 'ready',
+        'version': '1.0.0',
+        'category': 'sensor',
+        'dependencies': ['bluetooth'],
+        'features': [
+            'Fréquence cardiaque temps réel',
+            'Analyse de variabilité HRV',
+            'Détection d\'arythmies',
+            'Export des données ECG'
+        ],
+        'websocket_events': [
+            'start_monitoring',
+            'stop_monitoring',
+            'get_hrv_data'
+        ],
+        'config': {
+            'sample_rate': 130,
+            'device_type': 'H10',
+            'auto_connect': True
+        },
+        'created_at': _BOOT_TS
+    },
+    'neurosity': {
+        'name': 'Neurosity Crown',
+        'subtitle': 'EEG Monitor',
+        'description': 'Interface cerveau-ordinateur avec monitoring EEG en temps réel',
+        'icon': 'fas fa-brain',
+        'color': '#4ecdc4',
+        'badge': 'EEG',
+        'enabled': True,
+        'status': 'ready',
+        'version': '1.0.0',
+        'category': 'sensor',
+        'dependencies': ['neurosity_sdk', 'multiprocessing'],
+        'features': [
+            'Monitoring calme et concentration',
+            'Ondes cérébrales (Delta, Theta, Alpha, Beta, Gamma)',
+            'Signal EEG brut 8 canaux',
+            'Qualité du signal par électrode',
+            'Enregistrement CSV des sessions',
+            'Export et analyse des données'
+        ],
+        'websocket_events': [
+            'connect',
+            'disconnect',
+            'start_monitoring',
+            'stop_monitoring',
+            'start_recording',
+            'stop_recording',
+            'get_sessions'
+        ],
+        'config': {
+            'channels': 8,
+            'sample_rate': 256,
+            'electrodes': ['CP3', 'C3', 'F5', 'PO3', 'PO4', 'F6', 'C4', 'CP4'],
+            'device_name': 'Crown',
+            'data_types': ['calm', 'focus', 'brainwaves', 'raw_eeg'],
+            'recording_format': 'csv',
+            'auto_connect': False,
+            'auto_start_monitoring': True
+        },
+        'api_routes': [
+            {'path': '/api/neurosity/status', 'method': 'GET'},
+            {'path': '/api/neurosity/sessions', 'method': 'GET'},
+            {'path': '/api/neurosity/download/<filename>', 'method': 'GET'},
+            {'path': '/api/neurosity/analyze/<filename>', 'method': 'GET'}
+        ],
+        'created_at': _BOOT_TS
+    },
+    'thermal_camera': {
+        'name': 'Caméra Thermique',
+        'subtitle': 'Détection IR',
+        'description': 'Imagerie thermique et analyse de température corporelle',
+        'icon': 'fas fa-thermometer-half',
+        'color': '#45b7d1',
+        'badge': 'IR',
+        'enabled': True,
+        'status': 'ready',
+        'version': '1.0.0',
+        'category': 'sensor',
+        'dependencies': ['opencv', 'thermal_sdk'],
+        'features': [
+            'Imagerie infrarouge temps réel',
+            'Détection automatique de fièvre',
+            'Cartes de chaleur corporelle',
+            'Alertes de température'
+        ],
+        'websocket_events': [
+            'start_capture',
+            'stop_capture',
+            'get_temperature_map'
+        ],
+        'config': {
+            'resolution': '640x480',
+            'fps': 30,
+            'temperature_unit': 'celsius'
+        },
+        'created_at': _BOOT_TS
+    },
+    'gazepoint': {
+        'name': 'Gazepoint',
+        'subtitle': 'Suivi oculaire',
+        'description': 'Eye tracking et analyse d\'attention haute précision',
+        'icon': 'fas fa-eye',
+        'color': '#96ceb4',
+        'badge': 'Eye',
+        'enabled': True,
+        'status': 'ready',
+        'version': '1.0.0',
+        'category': 'sensor',
+        'dependencies': ['socket', 'xml'],
+        'features': [
+            'Tracking oculaire haute précision',
+            'Heatmaps de fixation du regard',
+            'Analyse des patterns d\'attention',
+            'Évaluation cognitive',
+            'Calibration 9 points',
+            'Enregistrement CSV des sessions',
+            'Zones d\'intérêt (AOI) configurables',
+            'Trajectoire du regard en temps réel'
+        ],
+        'websocket_events': [
+            'connect',
+            'disconnect',
+            'start_calibration',
+            'start_recording',
+            'stop_recording',
+            'get_sessions'
+        ],
+        'config': {
+            'server_ip': '127.0.0.1',
+            'server_port': 4242,
+            'sampling_rate': 60,
+            'calibration_points': 9,
+            'auto_connect': False
+        },
+        'api_routes': [
+            {'path': '/api/gazepoint/status', 'method': 'GET'},
+            {'path': '/api/gazepoint/download/<filename>', 'method': 'GET'}
+        ],
+        'created_at': _BOOT_TS
+    },
+    'thought_capture': {
+        'name': 'Capture de la Pensée',
+        'subtitle': 'BCI Interface',
+        'description': 'Interface cerveau-ordinateur pour décodage d\'intentions',
+        'icon': 'fas fa-lightbulb',
+        'color': '#feca57',
+        'badge': 'BCI',
+        'enabled': True,
+        'status': 'ready',
+        'version': '1.0.0',
+        'category': 'experimental',
+        'dependencies': ['bci_sdk', 'ml_models'],
+        'features': [
+            'Décodage d\'intentions mentales',
+            'Contrôle par la pensée',
+            'Apprentissage neuronal adaptatif',
+            'Interface neuronale directe'
+        ],
+        'websocket_events': [
+            'start_thought_capture',
+            'stop_thought_capture',
+            'decode_intention'
+        ],
+        'config': {
+            'model_type': 'neural_network',
+            'training_sessions': 10,
+            'confidence_threshold': 0.8
+        },
+        'created_at': _BOOT_TS
+    }
+}
+
+
 class ModuleRegistry:
     """Registre centralisé pour tous les modules du système"""
     
     def __init__(self):
         self.modules = {}
+        # Index secondaires (dict utilisé comme ensemble ordonné d'identifiants)
+        self._by_category = {}
+        self._enabled = {}
+        # Compteurs du résumé, tenus à jour avec les index
+        self._category_counts = Counter()
+        self._status_counts = Counter()
+        self._version = 0
+        self._modified_at = datetime.now(timezone.utc)
+        self._modules_payload = None  # (version, payload JSON, ETag)
         self._initialize_default_modules()
+        self._modules_view = MappingProxyType(self.modules)
+    
+    @property
+    def version(self):
+        """Compteur incrémenté à chaque modification du registre"""
+        return self._version
+    
+    @property
+    def modified_at(self):
+        """Date (UTC) de la dernière modification du registre"""
+        return self._modified_at
+    
+    def _bump(self):
+        """Invalider les données dérivées après une modification du registre"""
+        self._version += 1
+        self._modified_at = datetime.now(timezone.utc)
+    
+    def _index_module(self, module_id, module_config):
+        """Ajouter un module aux index secondaires"""
+        category = module_config.get('category')
+        self._by_category.setdefault(category, {})[module_id] = None
+        if module_config.get('enabled', False):
+            self._enabled[module_id] = None
+        self._category_counts[module_config.get('category', 'unknown')] += 1
+        self._status_counts[module_config.get('status', 'unknown')] += 1
+    
+    def _unindex_module(self, module_id):
+        """Retirer un module (s'il existe) des index secondaires"""
+        module_config = self.modules.get(module_id)
+        if module_config is None:
+            return
+        members = self._by_category.get(module_config.get('category'))
+        if members is not None:
+            members.pop(module_id, None)
+        self._enabled.pop(module_id, None)
+        self._category_counts[module_config.get('category', 'unknown')] -= 1
+        self._status_counts[module_config.get('status', 'unknown')] -= 1
+    
+    def _set_status(self, module_config, status):
+        """Changer le statut d'un module en tenant à jour les compteurs"""
+        self._status_counts[module_config.get('status', 'unknown')] -= 1
+        self._status_counts[status] += 1
+        module_config['status'] = status
+    
+    def _touch(self, module_id, stamp_field=None, **fields):
+        """Modifier des champs d'un module et horodater la modification
+
+        Tient à jour les index et compteurs si 'enabled' ou 'status' changent.
+
+        Args:
+            module_id (str): Identifiant du module
+            stamp_field (str): Champ recevant aussi l'horodatage (ex. 'activated_at')
+            **fields: Champs à modifier
+
+        Returns:
+            bool: False si le module n'existe pas
+        """
+        module = self.modules.get(module_id)
+        if module is None:
+            return False
+        
+        if 'status' in fields:
+            self._set_status(module, fields.pop('status'))
+        if 'enabled' in fields:
+            if fields['enabled']:
+                self._enabled[module_id] = None
+            else:
+                self._enabled.pop(module_id, None)
+        
+        ts = datetime.now()
+        fields['updated_at'] = ts
+        if stamp_field:
+            fields[stamp_field] = ts
+        module.update(fields)
+        self._bump()
+        return True
     
     def _initialize_default_modules(self):
         """Initialiser les modules par défaut"""
+        # Copie par module (et de son 'config', modifié par update_module_config);
+        # les autres valeurs sont remplacées, jamais modifiées sur place
         self.modules = {
-            'dashboard': {
-                'name': 'Base Principal',
-                'description': 'Centre de contrôle principal',
-                'icon': 'fas fa-dashboard',
-                'enabled': True,
-                'status': 'active',
-                'version': '1.0.0',
-                'category': 'core',
-                'dependencies': [],
-                'config': {},
-                'created_at': datetime.now().isoformat()
-            },
-            'polar': {
-                'name': 'Polar Monitor',
-                'subtitle': 'H10 / Verity Sense',
-                'description': 'Moniteur cardiaque et analyse ECG en temps réel',
-                'icon': 'fas fa-heartbeat',
-                'color': '#ff6b6b',
-                'badge': 'ECG',
-                'enabled': True,
-                'status': 'ready',
-                'version': '1.0.0',
-                'category': 'sensor',
-                'dependencies': ['bluetooth'],
-                'features': [
-                    'Fréquence cardiaque temps réel',
-                    'Analyse de variabilité HRV',
-                    'Détection d\'arythmies',
-                    'Export des données ECG'
-                ],
-                'websocket_events': [
-                    'start_monitoring',
-                    'stop_monitoring',
-                    'get_hrv_data'
-                ],
-                'config': {
-                    'sample_rate': 130,
-                    'device_type': 'H10',
-                    'auto_connect': True
-                },
-                'created_at': datetime.now().isoformat()
-            },
-            'neurosity': {
-                'name': 'Neurosity Crown',
-                'subtitle': 'EEG Monitor',
-                'description': 'Interface cerveau-ordinateur avec monitoring EEG en temps réel',
-                'icon': 'fas fa-brain',
-                'color': '#4ecdc4',
-                'badge': 'EEG',
-                'enabled': True,
-                'status': 'ready',
-                'version': '1.0.0',
-                'category': 'sensor',
-                'dependencies': ['neurosity_sdk', 'multiprocessing'],
-                'features': [
-                    'Monitoring calme et concentration',
-                    'Ondes cérébrales (Delta, Theta, Alpha, Beta, Gamma)',
-                    'Signal EEG brut 8 canaux',
-                    'Qualité du signal par électrode',
-                    'Enregistrement CSV des sessions',
-                    'Export et analyse des données'
-                ],
-                'websocket_events': [
-                    'connect',
-                    'disconnect',
-                    'start_monitoring',
-                    'stop_monitoring',
-                    'start_recording',
-                    'stop_recording',
-                    'get_sessions'
-                ],
-                'config': {
-                    'channels': 8,
-                    'sample_rate': 256,
-                    'electrodes': ['CP3', 'C3', 'F5', 'PO3', 'PO4', 'F6', 'C4', 'CP4'],
-                    'device_name': 'Crown',
-                    'data_types': ['calm', 'focus', 'brainwaves', 'raw_eeg'],
-                    'recording_format': 'csv',
-                    'auto_connect': False,
-                    'auto_start_monitoring': True
-                },
-                'api_routes': [
-                    {'path': '/api/neurosity/status', 'method': 'GET'},
-                    {'path': '/api/neurosity/sessions', 'method': 'GET'},
-                    {'path': '/api/neurosity/download/<filename>', 'method': 'GET'},
-                    {'path': '/api/neurosity/analyze/<filename>', 'method': 'GET'}
-                ],
-                'created_at': datetime.now().isoformat()
-            },
-            'thermal_camera': {
-                'name': 'Caméra Thermique',
-                'subtitle': 'Détection IR',
-                'description': 'Imagerie thermique et analyse de température corporelle',
-                'icon': 'fas fa-thermometer-half',
-                'color': '#45b7d1',
-                'badge': 'IR',
-                'enabled': True,
-                'status': 'ready',
-                'version': '1.0.0',
-                'category': 'sensor',
-                'dependencies': ['opencv', 'thermal_sdk'],
-                'features': [
-                    'Imagerie infrarouge temps réel',
-                    'Détection automatique de fièvre',
-                    'Cartes de chaleur corporelle',
-                    'Alertes de température'
-                ],
-                'websocket_events': [
-                    'start_capture',
-                    'stop_capture',
-                    'get_temperature_map'
-                ],
-                'config': {
-                    'resolution': '640x480',
-                    'fps': 30,
-                    'temperature_unit': 'celsius'
-                },
-                'created_at': datetime.now().isoformat()
-            },
-            'gazepoint': {
-                'name': 'Gazepoint',
-                'subtitle': 'Suivi oculaire',
-                'description': 'Eye tracking et analyse d\'attention haute précision',
-                'icon': 'fas fa-eye',
-                'color': '#96ceb4',
-                'badge': 'Eye',
-                'enabled': True,
-                'status': 'ready',
-                'version': '1.0.0',
-                'category': 'sensor',
-                'dependencies': ['socket', 'xml'],
-                'features': [
-                    'Tracking oculaire haute précision',
-                    'Heatmaps de fixation du regard',
-                    'Analyse des patterns d\'attention',
-                    'Évaluation cognitive',
-                    'Calibration 9 points',
-                    'Enregistrement CSV des sessions',
-                    'Zones d\'intérêt (AOI) configurables',
-                    'Trajectoire du regard en temps réel'
-                ],
-                'websocket_events': [
-                    'connect',
-                    'disconnect',
-                    'start_calibration',
-                    'start_recording',
-                    'stop_recording',
-                    'get_sessions'
-                ],
-                'config': {
-                    'server_ip': '127.0.0.1',
-                    'server_port': 4242,
-                    'sampling_rate': 60,
-                    'calibration_points': 9,
-                    'auto_connect': False
-                },
-                'api_routes': [
-                    {'path': '/api/gazepoint/status', 'method': 'GET'},
-                    {'path': '/api/gazepoint/download/<filename>', 'method': 'GET'}
-                ],
-                'created_at': datetime.now().isoformat()
-            },
-            'thought_capture': {
-                'name': 'Capture de la Pensée',
-                'subtitle': 'BCI Interface',
-                'description': 'Interface cerveau-ordinateur pour décodage d\'intentions',
-                'icon': 'fas fa-lightbulb',
-                'color': '#feca57',
-                'badge': 'BCI',
-                'enabled': True,
-                'status': 'ready',
-                'version': '1.0.0',
-                'category': 'experimental',
-                'dependencies': ['bci_sdk', 'ml_models'],
-                'features': [
-                    'Décodage d\'intentions mentales',
-                    'Contrôle par la pensée',
-                    'Apprentissage neuronal adaptatif',
-                    'Interface neuronale directe'
-                ],
-                'websocket_events': [
-                    'start_thought_capture',
-                    'stop_thought_capture',
-                    'decode_intention'
-                ],
-                'config': {
-                    'model_type': 'neural_network',
-                    'training_sessions': 10,
-                    'confidence_threshold': 0.8
-                },
-                'created_at': datetime.now().isoformat()
-            }
+            module_id: {**module, 'config': dict(module.get('config', {}))}
+            for module_id, module in _DEFAULT_MODULES.items()
         }
+        for module_id, module_config in self.modules.items():
+            self._index_module(module_id, module_config)
         
-        logger.info(f"Registre des modules initialisé avec {len(self.modules)} modules")
+        logger.info("Registre des modules initialisé avec %s modules", len(self.modules))
     
     def register_module(self, module_id, module_config):
         """Enregistrer un nouveau module
@@ -227,19 +363,24 @@ class ModuleRegistry:
             bool: True si l'enregistrement a réussi
         """
         if module_id in self.modules:
-            logger.warning(f"Module {module_id} déjà enregistré, mise à jour...")
+            logger.warning("Module %s déjà enregistré, mise à jour...", module_id)
         
         # Valider la configuration du module
         if not self._validate_module_config(module_config):
-            logger.error(f"Configuration invalide pour le module {module_id}")
+            logger.error("Configuration invalide pour le module %s", module_id)
             return False
         
         # Ajouter les métadonnées
-        module_config['created_at'] = datetime.now().isoformat()
-        module_config['updated_at'] = datetime.now().isoformat()
+        ts = datetime.now()
+        module_config['created_at'] = ts
+        module_config['updated_at'] = ts
         
+        _intern_fields(module_config)
+        self._unindex_module(module_id)
         self.modules[module_id] = module_config
-        logger.info(f"Module {module_id} enregistré avec succès")
+        self._index_module(module_id, module_config)
+        self._bump()
+        logger.info("Module %s enregistré avec succès", module_id)
         return True
     
     def unregister_module(self, module_id):
@@ -252,11 +393,13 @@ class ModuleRegistry:
             bool: True si la désinscription a réussi
         """
         if module_id not in self.modules:
-            logger.warning(f"Module {module_id} non trouvé pour désinscription")
+            logger.warning("Module %s non trouvé pour désinscription", module_id)
             return False
         
+        self._unindex_module(module_id)
         del self.modules[module_id]
-        logger.info(f"Module {module_id} désinscrit avec succès")
+        self._bump()
+        logger.info("Module %s désinscrit avec succès", module_id)
         return True
     
     def get_module(self, module_id):
@@ -273,10 +416,32 @@ class ModuleRegistry:
     def get_all_modules(self):
         """Récupérer tous les modules
 
+        La vue est en lecture seule et reflète les modifications ultérieures du
+        registre; utiliser dict(...) pour en obtenir une copie figée.
+
         Returns:
-            dict: Dictionnaire de tous les modules
+            MappingProxyType: Vue de tous les modules
         """
-        return self.modules.copy()
+        return self._modules_view
+    
+    def get_modules_payload(self):
+        """Récupérer la liste des modules sérialisée en JSON
+
+        La sérialisation est conservée jusqu'à la prochaine modification du registre.
+
+        Returns:
+            tuple: (payload JSON en bytes, ETag faible du payload, hors horodatage)
+        """
+        cached = self._modules_payload
+        if cached is None or cached[0] != self._version:
+            payload = dumps_registry({
+                'modules': self.modules,
+                'total': len(self.modules)
+            })
+            cached = (self._version, payload, hashlib.md5(payload).hexdigest())
+            self._modules_payload = cached
+        
+        return cached[1], cached[2]
     
     def get_modules_by_category(self, category):
         """Récupérer les modules par catégorie
@@ -287,11 +452,8 @@ class ModuleRegistry:
         Returns:
             dict: Modules de la catégorie spécifiée
         """
-        return {
-            module_id: module_config
-            for module_id, module_config in self.modules.items()
-            if module_config.get('category') == category
-        }
+        modules = self.modules
+        return {module_id: modules[module_id] for module_id in self._by_category.get(category, ())}
     
     def get_enabled_modules(self):
         """Récupérer uniquement les modules activés
@@ -299,11 +461,8 @@ class ModuleRegistry:
         Returns:
             dict: Modules activés
         """
-        return {
-            module_id: module_config
-            for module_id, module_config in self.modules.items()
-            if module_config.get('enabled', False)
-        }
+        modules = self.modules
+        return {module_id: modules[module_id] for module_id in self._enabled}
     
     def module_exists(self, module_id):
         """Vérifier si un module existe
@@ -325,12 +484,10 @@ class ModuleRegistry:
         Returns:
             bool: True si l'activation a réussi
         """
-        if module_id not in self.modules:
+        if not self._touch(module_id, enabled=True):
             return False
         
-        self.modules[module_id]['enabled'] = True
-        self.modules[module_id]['updated_at'] = datetime.now().isoformat()
-        logger.info(f"Module {module_id} activé")
+        logger.info("Module %s activé", module_id)
         return True
     
     def disable_module(self, module_id):
@@ -342,12 +499,10 @@ class ModuleRegistry:
         Returns:
             bool: True si la désactivation a réussi
         """
-        if module_id not in self.modules:
+        if not self._touch(module_id, enabled=False):
             return False
         
-        self.modules[module_id]['enabled'] = False
-        self.modules[module_id]['updated_at'] = datetime.now().isoformat()
-        logger.info(f"Module {module_id} désactivé")
+        logger.info("Module %s désactivé", module_id)
         return True
     
     def activate_module(self, module_id):
@@ -359,13 +514,10 @@ class ModuleRegistry:
         Returns:
             bool: True si l'activation a réussi
         """
-        if module_id not in self.modules:
+        if not self._touch(module_id, stamp_field='activated_at', status='active'):
             return False
         
-        self.modules[module_id]['status'] = 'active'
-        self.modules[module_id]['activated_at'] = datetime.now().isoformat()
-        self.modules[module_id]['updated_at'] = datetime.now().isoformat()
-        logger.info(f"Module {module_id} activé (statut: active)")
+        logger.info("Module %s activé (statut: active)", module_id)
         return True
     
     def deactivate_module(self, module_id):
@@ -377,13 +529,10 @@ class ModuleRegistry:
         Returns:
             bool: True si la désactivation a réussi
         """
-        if module_id not in self.modules:
+        if not self._touch(module_id, stamp_field='deactivated_at', status='inactive'):
             return False
         
-        self.modules[module_id]['status'] = 'inactive'
-        self.modules[module_id]['deactivated_at'] = datetime.now().isoformat()
-        self.modules[module_id]['updated_at'] = datetime.now().isoformat()
-        logger.info(f"Module {module_id} désactivé (statut: inactive)")
+        logger.info("Module %s désactivé (statut: inactive)", module_id)
         return True
     
     def update_module_config(self, module_id, config_updates):
@@ -396,17 +545,15 @@ class ModuleRegistry:
         Returns:
             bool: True si la mise à jour a réussi
         """
-        if module_id not in self.modules:
+        module = self.modules.get(module_id)
+        if module is None:
             return False
         
         # Mettre à jour la configuration
-        if 'config' not in self.modules[module_id]:
-            self.modules[module_id]['config'] = {}
-        
-        self.modules[module_id]['config'].update(config_updates)
-        self.modules[module_id]['updated_at'] = datetime.now().isoformat()
+        module.setdefault('config', {}).update(config_updates)
+        self._touch(module_id)
         
-        logger.info(f"Configuration du module {module_id} mise à jour")
+        logger.info("Configuration du module %s mise à jour", module_id)
         return True
     
     def get_modules_count(self):
@@ -423,23 +570,15 @@ class ModuleRegistry:
         Returns:
             dict: Résumé avec statistiques
         """
-        enabled_count = len(self.get_enabled_modules())
-        categories = {}
-        statuses = {}
-        
-        for module_config in self.modules.values():
-            category = module_config.get('category', 'unknown')
-            status = module_config.get('status', 'unknown')
-            
-            categories[category] = categories.get(category, 0) + 1
-            statuses[status] = statuses.get(status, 0) + 1
+        enabled_count = len(self._enabled)
         
+        # Le + unaire écarte les entrées retombées à zéro
         return {
             'total_modules': len(self.modules),
             'enabled_modules': enabled_count,
             'disabled_modules': len(self.modules) - enabled_count,
-            'categories': categories,
-            'statuses': statuses,
+            'categories': dict(+self._category_counts),
+            'statuses': dict(+self._status_counts),
             'timestamp': datetime.now().isoformat()
         }
     
@@ -452,39 +591,50 @@ class ModuleRegistry:
         Returns:
             bool: True si la configuration est valide
         """
-        required_fields = ['name', 'description', 'icon']
-        
-        for field in required_fields:
-            if field not in config:
-                logger.error(f"Champ requis manquant: {field}")
-                return False
+        missing = _REQUIRED_FIELDS.difference(config)
+        if missing:
+            logger.error("Champs requis manquants: %s", ', '.join(sorted(missing)))
+            return False
         
         # Valider les types
         if not isinstance(config.get('enabled', True), bool):
             logger.error("Le champ 'enabled' doit être un booléen")
             return False
         
-        if config.get('features') and not isinstance(config['features'], list):
-            logger.error("Le champ 'features' doit être une liste")
-            return False
-        
-        if config.get('dependencies') and not isinstance(config['dependencies'], list):
-            logger.error("Le champ 'dependencies' doit être une liste")
-            return False
+        for field in _LIST_FIELDS:
+            value = config.get(field)
+            if value and not isinstance(value, list):
+                logger.error("Le champ '%s' doit être une liste", field)
+                return False
         
         return True
     
+    def _export_document(self):
+        """Document d'export: le registre vivant, sans copie (sérialisé par dumps_registry)"""
+        return {
+            'modules': self.modules,
+            'exported_at': datetime.now(),
+            'version': '1.0.0'
+        }
+    
     def export_modules_config(self):
         """Exporter la configuration de tous les modules
 
         Returns:
-            dict: Configuration complète
+            dict: Configuration complète, horodatages en chaînes ISO
         """
-        return {
-            'modules': self.modules,
-            'exported_at': datetime.now().isoformat(),
-            'version': '1.0.0'
-        }
+        # Conversion des datetime faite par orjson plutôt qu'en recopiant chaque module
+        return orjson.loads(dumps_registry(self._export_document()))
+    
+    def export_modules_json(self, fp):
+        """Écrire la configuration de tous les modules en JSON dans un fichier
+
+        Même contenu que export_modules_config, sans objet Python intermédiaire.
+
+        Args:
+            fp: Fichier ouvert en écriture binaire
+        """
+        fp.write(dumps_registry(self._export_document()))
     
     def import_modules_config(self, config_data):
         """Importer une configuration de modules
@@ -502,10 +652,16 @@ class ModuleRegistry:
         imported_count = 0
         for module_id, module_config in config_data['modules'].items():
             if self._validate_module_config(module_config):
+                _intern_fields(module_config)
+                self._unindex_module(module_id)
                 self.modules[module_id] = module_config
+                self._index_module(module_id, module_config)
                 imported_count += 1
             else:
-                logger.warning(f"Configuration invalide pour le module {module_id}, ignoré")
+                logger.warning("Configuration invalide pour le module %s, ignoré", module_id)
+        
+        if imported_count:
+            self._bump()
         
-        logger.info(f"{imported_count} modules importés avec succès")
+        logger.info("%s modules importés avec succès", imported_count)
         return imported_count > 0
\ No newline at end of file
@@ -8,17 +8,96 @@ Version complète avec intégration Polar, Neurosity, Thermal, Gazepoint et Thou
 import asyncio
 import logging
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 import threading
 from collections import deque
+from itertools import islice
+from dataclasses import dataclass
 import time
+import queue
+
+import numpy as np
+
+from timestamps import now_iso
 
 logger = logging.getLogger(__name__)
 
+# Période d'émission des mises à jour coalescées (~30 Hz) et de l'état complet (s)
+UPDATE_INTERVAL = 0.033
+STATE_INTERVAL = 1.0
+
+# Taille maximale de la file d'ingestion (échantillons en attente de traitement)
+INGEST_QUEUE_SIZE = 2000
+
+# Nombre de points d'historique envoyés au frontend pour chaque graphique
+HISTORY_LENGTH = 20
+
+# Points thermiques du visage -> buffer de températures correspondant
+THERMAL_POINTS = {
+    'Nez': 'thermal_nez',
+    'Bouche': 'thermal_bouche',
+    'Œil_Gauche': 'thermal_oeil_gauche',
+    'Œil_Droit': 'thermal_oeil_droit',
+    'Joue_Gauche': 'thermal_joue_gauche',
+    'Joue_Droite': 'thermal_joue_droite',
+    'Front': 'thermal_front',
+    'Menton': 'thermal_menton'
+}
+
+# Flux de données du dashboard -> (événement émis vers le frontend, libellé des logs)
+UPDATE_EVENTS = {
+    'polar': ('polar_data_update', 'Polar'),
+    'neurosity': ('neurosity_data_update', 'Neurosity'),
+    'thermal': ('thermal_data_update', 'thermique'),
+    'gazepoint': ('gazepoint_data_update', 'Gazepoint')
+}
+
+# Valeur par défaut partagée des sous-dictionnaires de métriques absents (lecture seule)
+_NO_METRICS = MappingProxyType({})
+
+# Bandes de fréquence EEG suivies par le dashboard (une valeur par électrode)
+BRAINWAVES = ('delta', 'theta', 'alpha', 'beta', 'gamma')
+
+
+def _coerce_float(value):
+    """Convertir une mesure en float, None si elle n'est pas numérique"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float_or(value, default):
+    """Comme _coerce_float, mais avec une valeur par défaut pour un champ absent ou invalide"""
+    value = _coerce_float(value)
+    return default if value is None else value
+
+
+@dataclass(slots=True)
+class ModuleContainer:
+    """Références aux autres modules du hub (définies par app.py)"""
+    polar: Any = None
+    neurosity: Any = None
+    thermal: Any = None
+    gazepoint: Any = None
+    thought_capture: Any = None
+
 
 class DashboardHomeModule:
     """Module Dashboard Home pour la vue d'ensemble centralisée"""
     
+    # Attributs lus à chaque échantillon: slots plutôt qu'un __dict__ par instance
+    __slots__ = (
+        'app', 'websocket_manager', 'devices_state', 'data_buffers', 'session_stats',
+        'collection_state', 'modules', '_thermal_point_buffers', '_gaze_buffers',
+        '_last_gazepoint', '_last_brainwave_means',
+        '_total_samples', '_sample_lock',
+        '_update_builders', '_pending_updates', '_pending_lock',
+        '_shutdown_event', '_wake_event', '_update_thread',
+        '_ingest_queue', '_ingest_thread', '_ingest_dropped'
+    )
+    
     def __init__(self, app, websocket_manager):
         self.app = app
         self.websocket_manager = websocket_manager
@@ -97,10 +176,33 @@ class DashboardHomeModule:
             'audio_waveform': deque(maxlen=256)  # Buffer pour la forme d'onde
         }
         
-        # Statistiques de session
+        # (point thermique, buffer) résolus une fois pour le traitement des échantillons
+        self._thermal_point_buffers = tuple(
+            (point, self.data_buffers[buffer_name]) for point, buffer_name in THERMAL_POINTS.items()
+        )
+        
+        # Buffers Gazepoint vidés à la déconnexion
+        self._gaze_buffers = tuple(
+            self.data_buffers[buffer_name] for buffer_name in (
+                'gaze_x', 'gaze_y', 'pupil_left', 'pupil_right', 'fixation_duration', 'blink_rate'
+            )
+        )
+        
+        # Dernier paquet Gazepoint converti, par type de données (gaze, eye, fixation)
+        self._last_gazepoint = {}
+        
+        # Moyennes des bandes du dernier paquet d'ondes cérébrales (réutilisées à l'émission)
+        self._last_brainwave_means = {}
+        
+        # Compteur d'échantillons: incrémenté par le thread d'ingestion, remis à zéro
+        # par start_collection (thread Socket.IO), d'où le verrou (partagé avec
+        # le compteur d'éléments abandonnés de _enqueue)
+        self._total_samples = 0
+        self._sample_lock = threading.Lock()
+        
+        # Statistiques de session (total_samples: voir _get_total_samples)
         self.session_stats = {
             'start_time': None,
-            'total_samples': 0,
             'devices_active': 0,
             'total_recordings': 0,  # AJOUT: Compteur d'enregistrements
             'total_recording_duration': 0,  # AJOUT: Durée totale d'enregistrement
@@ -115,94 +217,243 @@ class DashboardHomeModule:
         }
         
         # Références aux autres modules (seront définies par app.py)
-        self.polar_module = None
-        self.neurosity_module = None
-        self.thermal_module = None
-        self.gazepoint_module = None
-        self.thought_capture_module = None  # AJOUT: Référence au module thought_capture
-        
-        # Thread de mise à jour périodique
-        self._running = True
+        self.modules = ModuleContainer()
+        
+        # Constructeurs des mises à jour, par flux de UPDATE_EVENTS
+        self._update_builders = {
+            'polar': self._build_polar_update,
+            'neurosity': self._build_neurosity_update,
+            'thermal': self._build_thermal_update,
+            'gazepoint': self._build_gazepoint_update
+        }
+        
+        # Dernière mise à jour en attente par flux: (flux, arguments),
+        # envoyée par la boucle périodique au lieu d'une émission par échantillon
+        self._pending_updates = {}
+        self._pending_lock = threading.Lock()
+        
+        # Thread de mise à jour périodique, réveillé par les nouvelles données
+        self._shutdown_event = threading.Event()
+        self._wake_event = threading.Event()
         self._update_thread = None
         
+        # Échantillons et connexions/déconnexions reçus des threads capteurs:
+        # (traitement, arguments), traités dans l'ordre par un thread dédié
+        # pour ne jamais bloquer l'acquisition
+        self._ingest_queue = queue.Queue(maxsize=INGEST_QUEUE_SIZE)
+        self._ingest_thread = None
+        self._ingest_dropped = 0
+        
         logger.info("Module Dashboard Home initialisé")
     
     def set_module_references(self, polar_module=None, neurosity_module=None, thermal_module=None,
                               gazepoint_module=None, thought_capture_module=None):
         """Définit les références aux autres modules"""
-        self.polar_module = polar_module
-        self.neurosity_module = neurosity_module
-        self.thermal_module = thermal_module
-        self.gazepoint_module = gazepoint_module
-        self.thought_capture_module = thought_capture_module  # AJOUT: Stocker la référence
+        self.modules = ModuleContainer(
+            polar=polar_module,
+            neurosity=neurosity_module,
+            thermal=thermal_module,
+            gazepoint=gazepoint_module,
+            thought_capture=thought_capture_module  # AJOUT: Stocker la référence
+        )
         logger.info("Références aux modules définies dans Dashboard Home")
     
     def start_periodic_updates(self):
         """Démarre les mises à jour périodiques"""
         if not self._update_thread or not self._update_thread.is_alive():
+            self._shutdown_event.clear()
             self._update_thread = threading.Thread(target=self._periodic_update_loop)
             self._update_thread.daemon = True
             self._update_thread.start()
             logger.info("Thread de mise à jour périodique démarré")
+        
+        if not self._ingest_thread or not self._ingest_thread.is_alive():
+            self._ingest_thread = threading.Thread(target=self._drain_loop)
+            self._ingest_thread.daemon = True
+            self._ingest_thread.start()
     
     def _periodic_update_loop(self):
         """Boucle de mise à jour périodique"""
-        while self._running:
+        next_state = 0.0
+        while not self._shutdown_event.is_set():
             try:
-                # Émettre l'état actuel toutes les secondes
-                self.emit_dashboard_state()
-                time.sleep(1)
+                self._flush_pending_updates()
+                
+                # Émettre l'état actuel toutes les secondes (si le dashboard est ouvert)
+                now = time.monotonic()
+                if now >= next_state:
+                    if self.websocket_manager.has_subscribers('home'):
+                        self.emit_dashboard_state()
+                    next_state = now + STATE_INTERVAL
+                
+                # Attendre de nouvelles données (ou l'échéance de l'état complet),
+                # puis laisser les échantillons suivants s'accumuler avant l'envoi
+                self._wake_event.wait(timeout=max(0.0, next_state - time.monotonic()))
+                self._wake_event.clear()
+                self._shutdown_event.wait(UPDATE_INTERVAL)
             except Exception as e:
                 logger.error(f"Erreur dans la boucle de mise à jour: {e}")
-                time.sleep(5)
+                self._shutdown_event.wait(5)
+    
+    def _enqueue(self, process, args, lifecycle=False):
+        """Mettre un traitement en file pour le thread d'ingestion
+
+        File pleine (thread bloqué): les échantillons sont abandonnés, les
+        connexions/déconnexions attendent une place pour rester ordonnées.
+        """
+        if self._shutdown_event.is_set():
+            return
+        try:
+            if lifecycle:
+                self._ingest_queue.put((process, args), timeout=1.0)
+            else:
+                self._ingest_queue.put_nowait((process, args))
+            
+        except queue.Full:
+            # Appelé par plusieurs threads capteurs: compteur sous verrou, comme _count_sample
+            with self._sample_lock:
+                self._ingest_dropped += 1
+                first_drop = self._ingest_dropped == 1
+            if lifecycle or first_drop:
+                logger.warning("File d'ingestion du dashboard pleine: %s abandonné", process.__name__)
+            return
+        
+        if self._ingest_dropped:
+            with self._sample_lock:
+                dropped, self._ingest_dropped = self._ingest_dropped, 0
+            if dropped:
+                logger.warning("File d'ingestion du dashboard: %d éléments abandonnés", dropped)
+    
+    def _drain_loop(self):
+        """Traite les éléments mis en file par les threads capteurs, dans l'ordre d'arrivée"""
+        while True:
+            item = self._ingest_queue.get()
+            if item is None:
+                # Sentinelle de stop(); une sentinelle restée d'un arrêt précédent est ignorée
+                if self._shutdown_event.is_set():
+                    break
+                continue
+            process, args = item
+            process(*args)  # Chaque traitement journalise ses propres erreurs
+    
+    def stop(self):
+        """Arrête la boucle de mise à jour périodique et le traitement des échantillons"""
+        self._shutdown_event.set()
+        self._wake_event.set()
+        if self._update_thread and self._update_thread.is_alive():
+            self._update_thread.join(timeout=2)
+        
+        # _enqueue refuse désormais les nouveaux éléments; réveiller le thread d'ingestion
+        if self._ingest_thread and self._ingest_thread.is_alive():
+            try:
+                self._ingest_queue.put(None, timeout=1.0)
+            except queue.Full:
+                pass
+            self._ingest_thread.join(timeout=2)
+    
+    def _schedule_update(self, key, stream, *args):
+        """Programmer la mise à jour d'un flux; seule la plus récente par clé est envoyée"""
+        # Sans client sur le dashboard, rien à construire (les buffers restent alimentés)
+        if not self.websocket_manager.has_subscribers('home'):
+            return
+        with self._pending_lock:
+            if not self._pending_updates:
+                self._wake_event.set()
+            self._pending_updates[key] = (stream, args)
+    
+    def _flush_pending_updates(self):
+        """Envoyer les mises à jour accumulées depuis le dernier passage
+
+        Toutes les mises à jour partent dans un seul événement 'dashboard_tick'
+        ({'updates': [[événement, données], ...]}) au lieu d'une trame par flux.
+        """
+        with self._pending_lock:
+            if not self._pending_updates:
+                return
+            pending, self._pending_updates = self._pending_updates, {}
+        
+        updates = []
+        for stream, args in pending.values():
+            update = self._build_update(stream, args)
+            if update:
+                updates.append(update)
+        
+        if updates:
+            try:
+                self.websocket_manager.emit_to_module('home', 'dashboard_tick', {
+                    'updates': updates,
+                    'timestamp': now_iso()
+                })
+            except Exception as e:
+                logger.error(f"Erreur émission des mises à jour groupées: {e}")
     
     # === GESTION DES DONNÉES POLAR ===
     
     def handle_polar_data(self, device_type: str, data: Dict[str, Any]):
+        """Met en file les données reçues du module Polar"""
+        self._enqueue(self._process_polar_data, (device_type, data))
+    
+    def _process_polar_data(self, device_type: str, data: Dict[str, Any]):
         """Traite les données reçues du module Polar"""
         try:
+            ts = now_iso()  # Horodatage commun à tous les points de l'échantillon
             # Mettre à jour l'état de l'appareil
             if device_type in ['h10', 'verity']:
-                self.devices_state['polar'][device_type]['connected'] = True
-                self.devices_state['polar'][device_type]['last_data'] = data
+                device_state = self.devices_state['polar'][device_type]
+                device_state['last_data'] = data
+                # L'état de connexion n'est écrit qu'au changement
+                if not device_state['connected']:
+                    device_state['connected'] = True
+                    self._update_active_devices_count()
                 
                 # Extraire les métriques importantes
                 if data.get('heart_rate'):
                     self.data_buffers['bpm'].append({
                         'value': data['heart_rate'],
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                 
                 # RR intervals
-                metrics = data.get('real_time_metrics', {})
-                rr_metrics = metrics.get('rr_metrics', {})
-                if rr_metrics.get('last_rr'):
+                try:
+                    rr_metrics = data['real_time_metrics']['rr_metrics']
+                    last_rr = rr_metrics['last_rr']
+                except (KeyError, TypeError):
+                    last_rr = None
+                if last_rr:
                     self.data_buffers['rr'].append({
-                        'value': rr_metrics['last_rr'],
+                        'value': last_rr,
                         'rmssd': rr_metrics.get('rmssd', 0),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                 
                 # Respiration RSA
-                breathing_metrics = metrics.get('breathing_metrics', {})
-                if breathing_metrics.get('frequency', 0) > 0:
+                try:
+                    breathing_metrics = data['real_time_metrics']['breathing_metrics']
+                    frequency = breathing_metrics['frequency']
+                except (KeyError, TypeError):
+                    frequency = 0
+                if frequency > 0:
                     self.data_buffers['breathing'].append({
-                        'value': breathing_metrics['frequency'],
+                        'value': frequency,
                         'amplitude': breathing_metrics.get('amplitude', 0),
                         'quality': breathing_metrics.get('quality', 'unknown'),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                 
                 # Incrémenter les compteurs
-                self.session_stats['total_samples'] += 1
+                self._count_sample()
                 
-                # Émettre la mise à jour via WebSocket
-                self.emit_polar_update(device_type, data)
+                # Programmer la mise à jour WebSocket (envoyée par la boucle périodique)
+                self._schedule_update(('polar', device_type), 'polar', device_type, data)
         
         except Exception as e:
             logger.error(f"Erreur traitement données Polar {device_type}: {e}")
     
     def handle_polar_connected(self, device_type: str, device_info: Dict[str, Any]):
+        """Met en file la connexion d'un appareil Polar"""
+        self._enqueue(self._process_polar_connected, (device_type, device_info), lifecycle=True)
+    
+    def _process_polar_connected(self, device_type: str, device_info: Dict[str, Any]):
         """Gère la connexion d'un appareil Polar"""
         try:
             if device_type in ['h10', 'verity']:
@@ -217,7 +468,7 @@ class DashboardHomeModule:
                     'module': 'polar',
                     'device_type': device_type,
                     'device_info': device_info,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso()
                 })
                 
                 logger.info(f"Appareil Polar {device_type} connecté dans Dashboard Home")
@@ -226,6 +477,10 @@ class DashboardHomeModule:
             logger.error(f"Erreur gestion connexion Polar {device_type}: {e}")
     
     def handle_polar_disconnected(self, device_type: str):
+        """Met en file la déconnexion d'un appareil Polar"""
+        self._enqueue(self._process_polar_disconnected, (device_type,), lifecycle=True)
+    
+    def _process_polar_disconnected(self, device_type: str):
         """Gère la déconnexion d'un appareil Polar"""
         try:
             if device_type in ['h10', 'verity']:
@@ -239,7 +494,7 @@ class DashboardHomeModule:
                 self.websocket_manager.emit_to_module('home', 'device_disconnected', {
                     'module': 'polar',
                     'device_type': device_type,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso()
                 })
                 
                 logger.info(f"Appareil Polar {device_type} déconnecté dans Dashboard Home")
@@ -250,55 +505,64 @@ class DashboardHomeModule:
     # === GESTION DES DONNÉES NEUROSITY ===
     
     def handle_neurosity_data(self, data_type: str, data: Dict[str, Any]):
+        """Met en file les données du module Neurosity"""
+        self._enqueue(self._process_neurosity_data, (data_type, data))
+    
+    def _process_neurosity_data(self, data_type: str, data: Dict[str, Any]):
         """Traite les données du module Neurosity selon leur type"""
         try:
-            self.devices_state['neurosity']['connected'] = True
-            self.devices_state['neurosity']['last_data'] = data
+            ts = now_iso()
+            device_state = self.devices_state['neurosity']
+            device_state['last_data'] = data
+            if not device_state['connected']:
+                device_state['connected'] = True
+                self._update_active_devices_count()
             
             # Traiter selon le type de données
-            if data_type == 'calm':
-                value = data.get('calm', data.get('percentage', 0))
-                if isinstance(value, (int, float)):
-                    self.data_buffers['calm'].append({
-                        'value': value,
-                        'timestamp': datetime.now().isoformat()
-                    })
-            
-            elif data_type == 'focus':
-                value = data.get('focus', data.get('percentage', 0))
-                if isinstance(value, (int, float)):
-                    self.data_buffers['focus'].append({
-                        'value': value,
-                        'timestamp': datetime.now().isoformat()
-                    })
+            value = None
+            if data_type in ('calm', 'focus'):
+                value = _coerce_float(data.get(data_type, data.get('percentage', 0)))
+                if value is None:
+                    # Valeur non numérique: ne pas remplacer une mise à jour valide en attente
+                    return
+                self.data_buffers[data_type].append({
+                    'value': value,
+                    'timestamp': ts
+                })
             
             elif data_type == 'brainwaves':
                 # Traiter toutes les ondes cérébrales
-                for wave in ['delta', 'theta', 'alpha', 'beta', 'gamma']:
-                    if wave in data:
-                        values = data[wave]
-                        if isinstance(values, list) and len(values) == 8:
-                            # Calculer la moyenne des 8 électrodes
-                            avg_value = sum(values) / len(values)
-                            self.data_buffers[wave].append({
-                                'value': avg_value,
-                                'timestamp': datetime.now().isoformat()
-                            })
+                waves = [wave for wave in BRAINWAVES
+                         if isinstance(data.get(wave), list) and len(data[wave]) == 8]
+                # Moyenne des 8 électrodes, pour toutes les bandes en une seule réduction
+                means = []
+                if waves:
+                    means = np.array([data[wave] for wave in waves], dtype=np.float64).mean(axis=1).tolist()
+                self._last_brainwave_means = dict(zip(waves, means))
+                for wave, avg_value in self._last_brainwave_means.items():
+                    self.data_buffers[wave].append({
+                        'value': avg_value,
+                        'timestamp': ts
+                    })
             
             elif data_type == 'battery':
                 self.devices_state['neurosity']['battery'] = data.get('level', 0)
                 self.devices_state['neurosity']['charging'] = data.get('charging', False)
             
             # Incrémenter les statistiques
-            self.session_stats['total_samples'] += 1
+            self._count_sample()
             
-            # Émettre la mise à jour
-            self.emit_neurosity_update(data_type, data)
+            # Programmer la mise à jour
+            self._schedule_update(('neurosity', data_type), 'neurosity', data_type, data, value)
         
         except Exception as e:
             logger.error(f"Erreur traitement données Neurosity {data_type}: {e}")
     
     def handle_neurosity_connected(self, data: Dict[str, Any]):
+        """Met en file la connexion du casque Neurosity"""
+        self._enqueue(self._process_neurosity_connected, (data,), lifecycle=True)
+    
+    def _process_neurosity_connected(self, data: Dict[str, Any]):
         """Gère la connexion du casque Neurosity"""
         try:
             self.devices_state['neurosity']['connected'] = True
@@ -311,7 +575,7 @@ class DashboardHomeModule:
             self.websocket_manager.emit_to_module('home', 'device_connected', {
                 'module': 'neurosity',
                 'device_info': data.get('device_status', {}),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info("Casque Neurosity connecté dans Dashboard Home")
@@ -320,6 +584,10 @@ class DashboardHomeModule:
             logger.error(f"Erreur gestion connexion Neurosity: {e}")
     
     def handle_neurosity_disconnected(self, data: Dict[str, Any]):
+        """Met en file la déconnexion du casque Neurosity"""
+        self._enqueue(self._process_neurosity_disconnected, (data,), lifecycle=True)
+    
+    def _process_neurosity_disconnected(self, data: Dict[str, Any]):
         """Gère la déconnexion du casque Neurosity"""
         try:
             self.devices_state['neurosity']['connected'] = False
@@ -334,7 +602,7 @@ class DashboardHomeModule:
             # Notifier le frontend
             self.websocket_manager.emit_to_module('home', 'device_disconnected', {
                 'module': 'neurosity',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info("Casque Neurosity déconnecté dans Dashboard Home")
@@ -345,47 +613,47 @@ class DashboardHomeModule:
     # === GESTION DES DONNÉES THERMAL ===
     
     def handle_thermal_data(self, data: Dict[str, Any]):
+        """Met en file les données thermiques reçues"""
+        self._enqueue(self._process_thermal_data, (data,))
+    
+    def _process_thermal_data(self, data: Dict[str, Any]):
         """Traite les données thermiques reçues"""
         try:
+            ts = now_iso()
             # Mettre à jour l'état
-            self.devices_state['thermal']['connected'] = True
-            self.devices_state['thermal']['capturing'] = True
-            self.devices_state['thermal']['last_data'] = data
+            device_state = self.devices_state['thermal']
+            device_state['last_data'] = data
+            if not device_state['connected']:
+                device_state['connected'] = True
+                self._update_active_devices_count()
+            device_state['capturing'] = True
             
             # Extraire les températures
             temperatures = data.get('temperatures', {})
             
-            # Mapper les noms des points thermiques
-            point_mapping = {
-                'Nez': 'thermal_nez',
-                'Bouche': 'thermal_bouche',
-                'Œil_Gauche': 'thermal_oeil_gauche',
-                'Œil_Droit': 'thermal_oeil_droit',
-                'Joue_Gauche': 'thermal_joue_gauche',
-                'Joue_Droite': 'thermal_joue_droite',
-                'Front': 'thermal_front',
-                'Menton': 'thermal_menton'
-            }
-            
             # Stocker chaque température dans son buffer
-            for point, buffer_name in point_mapping.items():
+            for point, buffer in self._thermal_point_buffers:
                 temp = temperatures.get(point)
                 if temp is not None:
-                    self.data_buffers[buffer_name].append({
+                    buffer.append({
                         'value': temp,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
             
             # Incrémenter les statistiques
-            self.session_stats['total_samples'] += 1
+            self._count_sample()
             
-            # Émettre la mise à jour
-            self.emit_thermal_update(data)
+            # Programmer la mise à jour
+            self._schedule_update('thermal', 'thermal', data)
         
         except Exception as e:
             logger.error(f"Erreur traitement données thermiques: {e}")
     
     def handle_thermal_connected(self):
+        """Met en file la connexion du module thermique"""
+        self._enqueue(self._process_thermal_connected, (), lifecycle=True)
+    
+    def _process_thermal_connected(self):
         """Gère la connexion du module thermique"""
         try:
             self.devices_state['thermal']['connected'] = True
@@ -397,7 +665,7 @@ class DashboardHomeModule:
             # Notifier le frontend
             self.websocket_manager.emit_to_module('home', 'device_connected', {
                 'module': 'thermal',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info("Module thermique connecté dans Dashboard Home")
@@ -406,6 +674,10 @@ class DashboardHomeModule:
             logger.error(f"Erreur gestion connexion thermique: {e}")
     
     def handle_thermal_disconnected(self):
+        """Met en file la déconnexion du module thermique"""
+        self._enqueue(self._process_thermal_disconnected, (), lifecycle=True)
+    
+    def _process_thermal_disconnected(self):
         """Gère la déconnexion du module thermique"""
         try:
             self.devices_state['thermal']['connected'] = False
@@ -413,9 +685,8 @@ class DashboardHomeModule:
             self.devices_state['thermal']['last_data'] = None
             
             # Vider les buffers thermiques
-            for point in ['thermal_nez', 'thermal_bouche', 'thermal_oeil_gauche', 'thermal_oeil_droit',
-                          'thermal_joue_gauche', 'thermal_joue_droite', 'thermal_front', 'thermal_menton']:
-                self.data_buffers[point].clear()
+            for _, buffer in self._thermal_point_buffers:
+                buffer.clear()
             
             # Mettre à jour le compteur d'appareils actifs
             self._update_active_devices_count()
@@ -423,7 +694,7 @@ class DashboardHomeModule:
             # Notifier le frontend
             self.websocket_manager.emit_to_module('home', 'device_disconnected', {
                 'module': 'thermal',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info("Module thermique déconnecté dans Dashboard Home")
@@ -434,72 +705,106 @@ class DashboardHomeModule:
     # === GESTION DES DONNÉES GAZEPOINT ===
     
     def handle_gazepoint_data(self, data_type: str, data: Dict[str, Any]):
+        """Met en file les données du module Gazepoint"""
+        self._enqueue(self._process_gazepoint_data, (data_type, data))
+    
+    def _process_gazepoint_data(self, data_type: str, data: Dict[str, Any]):
         """Traite les données du module Gazepoint selon leur type"""
         try:
-            self.devices_state['gazepoint']['connected'] = True
-            self.devices_state['gazepoint']['last_data'] = data
+            ts = now_iso()
+            device_state = self.devices_state['gazepoint']
+            device_state['last_data'] = data
+            if not device_state['connected']:
+                device_state['connected'] = True
+                self._update_active_devices_count()
             
-            # Traiter selon le type de données
+            # Traiter selon le type de données; les valeurs converties une seule fois
+            # sont gardées pour la mise à jour envoyée au frontend
+            parsed = None
             if data_type == 'gaze':
                 # Position du regard
-                if 'gaze_data' in data and data['gaze_data']:
-                    gaze_data = data['gaze_data']
-                    if 'FPOGX' in gaze_data and 'FPOGY' in gaze_data:
-                        x = float(gaze_data['FPOGX'])
-                        y = float(gaze_data['FPOGY'])
+                gaze_data = data.get('gaze_data')
+                if gaze_data:
+                    # Chaque champ est converti séparément: un champ invalide
+                    # n'écarte pas le reste de l'échantillon
+                    x = _coerce_float(gaze_data.get('FPOGX'))
+                    y = _coerce_float(gaze_data.get('FPOGY'))
+                    parsed = {
+                        'x': 0.0 if x is None else x,
+                        'y': 0.0 if y is None else y,
+                        'validity': gaze_data.get('FPOGV', 0)
+                    }
+                    if x is not None and y is not None:
                         self.data_buffers['gaze_x'].append({
                             'value': x,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': ts
                         })
                         self.data_buffers['gaze_y'].append({
                             'value': y,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': ts
                         })
             
             elif data_type == 'eye':
-                # Données oculaires
-                if 'eye_data' in data and data['eye_data']:
-                    eye_data = data['eye_data']
+                # Données oculaires (le taux de clignement est calculé côté client
+                # à partir de left_open/right_open)
+                eye_data = data.get('eye_data')
+                if eye_data:
+                    left_pupil = _coerce_float(eye_data.get('LPUPILD'))
+                    right_pupil = _coerce_float(eye_data.get('RPUPILD'))
+                    parsed = {
+                        'left_pupil': 0.0 if left_pupil is None else left_pupil,
+                        'right_pupil': 0.0 if right_pupil is None else right_pupil,
+                        'left_open': _float_or(eye_data.get('LEYEOPENESS'), 0.0) > 0.5,
+                        'right_open': _float_or(eye_data.get('REYEOPENESS'), 0.0) > 0.5,
+                        'left_gaze_x': _float_or(eye_data.get('LEYEGAZEX'), 0.5),
+                        'left_gaze_y': _float_or(eye_data.get('LEYEGAZEY'), 0.5),
+                        'right_gaze_x': _float_or(eye_data.get('REYEGAZEX'), 0.5),
+                        'right_gaze_y': _float_or(eye_data.get('REYEGAZEY'), 0.5)
+                    }
                     # Taille des pupilles
-                    if 'LPUPILD' in eye_data:
+                    if left_pupil is not None:
                         self.data_buffers['pupil_left'].append({
-                            'value': float(eye_data['LPUPILD']),
-                            'timestamp': datetime.now().isoformat()
+                            'value': left_pupil,
+                            'timestamp': ts
                         })
-                    if 'RPUPILD' in eye_data:
+                    if right_pupil is not None:
                         self.data_buffers['pupil_right'].append({
-                            'value': float(eye_data['RPUPILD']),
-                            'timestamp': datetime.now().isoformat()
+                            'value': right_pupil,
+                            'timestamp': ts
                         })
-                    
-                    # Taux de clignement (calculé côté client, on peut stocker un état)
-                    if 'LEYEOPENESS' in eye_data and 'REYEOPENESS' in eye_data:
-                        left_open = float(eye_data['LEYEOPENESS']) > 0.5
-                        right_open = float(eye_data['REYEOPENESS']) > 0.5
-                        both_closed = not left_open and not right_open
-                        # On pourrait calculer le taux de clignement ici
             
             elif data_type == 'fixation':
                 # Données de fixation
-                if 'fixation_data' in data and data['fixation_data']:
-                    fix_data = data['fixation_data']
-                    if 'FPOGD' in fix_data:
-                        duration = float(fix_data['FPOGD'])
+                fix_data = data.get('fixation_data')
+                if fix_data:
+                    duration = _coerce_float(fix_data.get('FPOGD'))
+                    parsed = {
+                        'duration': 0.0 if duration is None else duration,
+                        'x': _float_or(fix_data.get('FPOGX'), 0.0),
+                        'y': _float_or(fix_data.get('FPOGY'), 0.0)
+                    }
+                    if duration is not None:
                         self.data_buffers['fixation_duration'].append({
                             'value': duration,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': ts
                         })
             
+            self._last_gazepoint[data_type] = parsed
+            
             # Incrémenter les statistiques
-            self.session_stats['total_samples'] += 1
+            self._count_sample()
             
-            # Émettre la mise à jour
-            self.emit_gazepoint_update(data_type, data)
+            # Programmer la mise à jour
+            self._schedule_update(('gazepoint', data_type), 'gazepoint', data_type, data)
         
         except Exception as e:
             logger.error(f"Erreur traitement données Gazepoint {data_type}: {e}")
     
     def handle_gazepoint_connected(self, data: Dict[str, Any]):
+        """Met en file la connexion du Gazepoint"""
+        self._enqueue(self._process_gazepoint_connected, (data,), lifecycle=True)
+    
+    def _process_gazepoint_connected(self, data: Dict[str, Any]):
         """Gère la connexion du Gazepoint"""
         try:
             self.devices_state['gazepoint']['connected'] = True
@@ -514,7 +819,7 @@ class DashboardHomeModule:
             self.websocket_manager.emit_to_module('home', 'device_connected', {
                 'module': 'gazepoint',
                 'device_info': data.get('device_info', {}),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info("Gazepoint connecté dans Dashboard Home")
@@ -523,6 +828,10 @@ class DashboardHomeModule:
             logger.error(f"Erreur gestion connexion Gazepoint: {e}")
     
     def handle_gazepoint_disconnected(self, data: Dict[str, Any]):
+        """Met en file la déconnexion du Gazepoint"""
+        self._enqueue(self._process_gazepoint_disconnected, (data,), lifecycle=True)
+    
+    def _process_gazepoint_disconnected(self, data: Dict[str, Any]):
         """Gère la déconnexion du Gazepoint"""
         try:
             self.devices_state['gazepoint']['connected'] = False
@@ -532,10 +841,8 @@ class DashboardHomeModule:
             self.devices_state['gazepoint']['tracking_status'] = 'none'
             
             # Vider les buffers Gazepoint
-            for buffer_name in ['gaze_x', 'gaze_y', 'pupil_left', 'pupil_right',
-                                'fixation_duration', 'blink_rate']:
-                if buffer_name in self.data_buffers:
-                    self.data_buffers[buffer_name].clear()
+            for buffer in self._gaze_buffers:
+                buffer.clear()
             
             # Mettre à jour le compteur d'appareils actifs
             self._update_active_devices_count()
@@ -543,7 +850,7 @@ class DashboardHomeModule:
             # Notifier le frontend
             self.websocket_manager.emit_to_module('home', 'device_disconnected', {
                 'module': 'gazepoint',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info("Gazepoint déconnecté dans Dashboard Home")
@@ -566,7 +873,7 @@ class DashboardHomeModule:
                 
                 # Notifier le frontend
                 self.websocket_manager.emit_to_module('home', 'thought_capture_recording_started', {
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso()
                 })
             
             elif data_type == 'recording_stopped':
@@ -585,7 +892,7 @@ class DashboardHomeModule:
                 self.websocket_manager.emit_to_module('home', 'thought_capture_recording_stopped', {
                     'duration': data.get('duration', 0),
                     'size': data.get('size', 0),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso()
                 })
             
             elif data_type == 'recording_paused':
@@ -594,7 +901,7 @@ class DashboardHomeModule:
                 
                 # Notifier le frontend
                 self.websocket_manager.emit_to_module('home', 'thought_capture_recording_paused', {
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso()
                 })
             
             elif data_type == 'recording_resumed':
@@ -603,21 +910,22 @@ class DashboardHomeModule:
                 
                 # Notifier le frontend
                 self.websocket_manager.emit_to_module('home', 'thought_capture_recording_resumed', {
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': now_iso()
                 })
             
             elif data_type == 'audio_level':
                 # Niveau audio en temps réel
+                ts = now_iso()
                 if 'level' in data:
                     self.data_buffers['audio_level'].append({
                         'value': data['level'],
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                 
                 if 'frequency' in data:
                     self.data_buffers['audio_frequency'].append({
                         'value': data['frequency'],
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': ts
                     })
                 
                 if 'waveform' in data:
@@ -649,17 +957,19 @@ class DashboardHomeModule:
             
             # Incrémenter les statistiques générales
             if data_type in ['audio_level', 'recording_started', 'recording_stopped']:
-                self.session_stats['total_samples'] += 1
+                self._count_sample()
         
         except Exception as e:
             logger.error(f"Erreur traitement données Thought Capture {data_type}: {e}")
     
     def emit_thought_capture_update(self, update_type: str, data: Dict[str, Any]):
         """Émet une mise à jour Thought Capture vers le frontend"""
+        if not self.websocket_manager.has_subscribers('home'):
+            return
         try:
             update_data = {
                 'update_type': update_type,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso(),
                 'data': data
             }
             
@@ -686,182 +996,142 @@ class DashboardHomeModule:
     
     # === ÉMISSION DES MISES À JOUR ===
     
-    def emit_polar_update(self, device_type: str, data: Dict[str, Any]):
-        """Émet une mise à jour Polar vers le frontend"""
+    def _tail(self, buffer_name, n=HISTORY_LENGTH):
+        """Derniers points d'un buffer, en ne parcourant que ces n points (depuis la fin)"""
+        tail = list(islice(reversed(self.data_buffers[buffer_name]), n))
+        tail.reverse()
+        return tail
+    
+    def _tail_series(self, buffer_name, n=HISTORY_LENGTH):
+        """Derniers points d'un buffer en deux listes parallèles (valeurs, timestamps)"""
+        points = self._tail(buffer_name, n)
+        return [p['value'] for p in points], [p['timestamp'] for p in points]
+    
+    def _build_update(self, stream, args):
+        """(événement, données) de la mise à jour d'un flux (polar, neurosity...), None en cas d'erreur"""
+        event, label = UPDATE_EVENTS[stream]
         try:
-            # Préparer les données pour le frontend
-            update_data = {
-                'device_type': device_type,
-                'heart_rate': data.get('heart_rate', 0),
-                'battery_level': data.get('battery_level', 0),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # Ajouter les métriques temps réel
-            metrics = data.get('real_time_metrics', {})
-            
-            # BPM metrics
-            bpm_metrics = metrics.get('bpm_metrics', {})
-            update_data['bpm'] = {
-                'current': bpm_metrics.get('current_bpm', 0),
-                'min': bpm_metrics.get('session_min', 0),
-                'max': bpm_metrics.get('session_max', 0),
-                'avg': bpm_metrics.get('mean_bpm', 0)
-            }
-            
-            # RR metrics
-            rr_metrics = metrics.get('rr_metrics', {})
-            update_data['rr'] = {
-                'last': rr_metrics.get('last_rr', 0),
-                'rmssd': rr_metrics.get('rmssd', 0),
-                'mean': rr_metrics.get('mean_rr', 0)
-            }
-            
-            # Breathing metrics
-            breathing_metrics = metrics.get('breathing_metrics', {})
-            update_data['breathing'] = {
-                'rate': breathing_metrics.get('frequency', 0),
-                'amplitude': breathing_metrics.get('amplitude', 0),
-                'quality': breathing_metrics.get('quality', 'unknown')
-            }
-            
-            # Graphiques - derniers points
-            update_data['graphs'] = {
-                'bpm': list(self.data_buffers['bpm'])[-20:],  # 20 derniers points
-                'rr': list(self.data_buffers['rr'])[-20:]
-            }
-            
-            # Émettre vers le module home
-            self.websocket_manager.emit_to_module('home', 'polar_data_update', update_data)
-        
+            update_data = self._update_builders[stream](*args)
         except Exception as e:
-            logger.error(f"Erreur émission mise à jour Polar: {e}")
+            logger.error(f"Erreur émission mise à jour {label}: {e}")
+            return None
+        
+        update_data['timestamp'] = now_iso()
+        return event, update_data
     
-    def emit_neurosity_update(self, data_type: str, data: Dict[str, Any]):
-        """Émet une mise à jour Neurosity vers le frontend"""
-        try:
-            update_data = {
-                'data_type': data_type,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            if data_type == 'calm':
-                value = data.get('calm', data.get('percentage', 0))
-                update_data['calm'] = value * 100 if value <= 1 else value
-                update_data['calm_history'] = list(self.data_buffers['calm'])[-20:]
-            
-            elif data_type == 'focus':
-                value = data.get('focus', data.get('percentage', 0))
-                update_data['focus'] = value * 100 if value <= 1 else value
-                update_data['focus_history'] = list(self.data_buffers['focus'])[-20:]
-            
-            elif data_type == 'brainwaves':
-                # Envoyer toutes les ondes cérébrales
-                brainwaves_data = {}
-                brainwaves_history = {}
-                
-                for wave in ['delta', 'theta', 'alpha', 'beta', 'gamma']:
-                    if wave in data:
-                        values = data[wave]
-                        if isinstance(values, list) and len(values) == 8:
-                            avg_value = sum(values) / len(values)
-                            brainwaves_data[wave] = avg_value
-                            brainwaves_history[wave] = list(self.data_buffers[wave])[-20:]
-                
-                update_data['brainwaves'] = brainwaves_data
-                update_data['brainwaves_history'] = brainwaves_history
-            
-            elif data_type == 'battery':
-                update_data['battery'] = data.get('level', 0)
-                update_data['charging'] = data.get('charging', False)
-            
-            # Émettre vers le module home
-            self.websocket_manager.emit_to_module('home', 'neurosity_data_update', update_data)
+    def _build_polar_update(self, device_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prépare la mise à jour Polar pour le frontend"""
+        update_data = {
+            'device_type': device_type,
+            'heart_rate': data.get('heart_rate', 0),
+            'battery_level': data.get('battery_level', 0)
+        }
         
-        except Exception as e:
-            logger.error(f"Erreur émission mise à jour Neurosity: {e}")
+        # Ajouter les métriques temps réel
+        metrics = data.get('real_time_metrics', _NO_METRICS)
+        
+        # BPM metrics
+        bpm_metrics = metrics.get('bpm_metrics', _NO_METRICS)
+        update_data['bpm'] = {
+            'current': bpm_metrics.get('current_bpm', 0),
+            'min': bpm_metrics.get('session_min', 0),
+            'max': bpm_metrics.get('session_max', 0),
+            'avg': bpm_metrics.get('mean_bpm', 0)
+        }
+        
+        # RR metrics
+        rr_metrics = metrics.get('rr_metrics', _NO_METRICS)
+        update_data['rr'] = {
+            'last': rr_metrics.get('last_rr', 0),
+            'rmssd': rr_metrics.get('rmssd', 0),
+            'mean': rr_metrics.get('mean_rr', 0)
+        }
+        
+        # Breathing metrics
+        breathing_metrics = metrics.get('breathing_metrics', _NO_METRICS)
+        update_data['breathing'] = {
+            'rate': breathing_metrics.get('frequency', 0),
+            'amplitude': breathing_metrics.get('amplitude', 0),
+            'quality': breathing_metrics.get('quality', 'unknown')
+        }
+        
+        # Graphiques - HISTORY_LENGTH derniers points, valeurs et timestamps en parallèle
+        bpm, bpm_ts = self._tail_series('bpm')
+        rr, rr_ts = self._tail_series('rr')
+        update_data['graphs'] = {
+            'bpm': bpm,
+            'bpm_ts': bpm_ts,
+            'rr': rr,
+            'rr_ts': rr_ts
+        }
+        return update_data
     
-    def emit_thermal_update(self, data: Dict[str, Any]):
-        """Émet une mise à jour thermique vers le frontend"""
-        try:
-            update_data = {
-                'temperatures': data.get('temperatures', {}),
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            # Ajouter l'historique des températures pour le graphique
-            thermal_history = {}
-            for point in ['Nez', 'Bouche', 'Œil_Gauche', 'Œil_Droit',
-                          'Joue_Gauche', 'Joue_Droite', 'Front', 'Menton']:
-                buffer_name = f"thermal_{point.lower().replace('_', '_').replace('œ', 'oe')}"
-                if buffer_name in self.data_buffers:
-                    thermal_history[point] = list(self.data_buffers[buffer_name])[-20:]
+    def _build_neurosity_update(self, data_type: str, data: Dict[str, Any],
+                                value: Optional[float] = None) -> Dict[str, Any]:
+        """Prépare la mise à jour Neurosity pour le frontend (value: calm/focus déjà converti en float)"""
+        update_data = {'data_type': data_type}
+        
+        if data_type in ('calm', 'focus'):
+            update_data[data_type] = value * 100 if value <= 1 else value
+            update_data[f'{data_type}_history'] = self._tail(data_type)
+        
+        elif data_type == 'brainwaves':
+            # Envoyer toutes les ondes cérébrales
+            brainwaves_data = {}
+            brainwaves_history = {}
             
-            update_data['thermal_history'] = thermal_history
+            # Moyennes déjà calculées par _process_neurosity_data pour ce paquet
+            for wave, avg_value in self._last_brainwave_means.items():
+                brainwaves_data[wave] = avg_value
+                brainwaves_history[wave] = self._tail(wave)
             
-            # Émettre vers le module home
-            self.websocket_manager.emit_to_module('home', 'thermal_data_update', update_data)
+            update_data['brainwaves'] = brainwaves_data
+            update_data['brainwaves_history'] = brainwaves_history
         
-        except Exception as e:
-            logger.error(f"Erreur émission mise à jour thermique: {e}")
+        elif data_type == 'battery':
+            update_data['battery'] = data.get('level', 0)
+            update_data['charging'] = data.get('charging', False)
+        
+        return update_data
     
-    def emit_gazepoint_update(self, data_type: str, data: Dict[str, Any]):
-        """Émet une mise à jour Gazepoint vers le frontend"""
-        try:
-            update_data = {
-                'data_type': data_type,
-                'timestamp': datetime.now().isoformat()
+    def _build_thermal_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prépare la mise à jour thermique pour le frontend"""
+        return {
+            'temperatures': data.get('temperatures', {}),
+            # Historique des températures pour le graphique
+            'thermal_history': {
+                point: self._tail(buffer_name) for point, buffer_name in THERMAL_POINTS.items()
+            }
+        }
+    
+    def _build_gazepoint_update(self, data_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prépare la mise à jour Gazepoint pour le frontend"""
+        update_data = {'data_type': data_type}
+        
+        # Valeurs déjà converties par _process_gazepoint_data pour ce paquet
+        parsed = self._last_gazepoint.get(data_type)
+        if not parsed:
+            return update_data
+        
+        if data_type == 'gaze':
+            update_data['gaze'] = parsed
+            update_data['gaze_history'] = {
+                'x': self._tail('gaze_x'),
+                'y': self._tail('gaze_y')
             }
-            
-            if data_type == 'gaze':
-                # Extraire les données de regard
-                if 'gaze_data' in data and data['gaze_data']:
-                    gaze_data = data['gaze_data']
-                    update_data['gaze'] = {
-                        'x': float(gaze_data.get('FPOGX', 0)),
-                        'y': float(gaze_data.get('FPOGY', 0)),
-                        'validity': gaze_data.get('FPOGV', 0)
-                    }
-                    update_data['gaze_history'] = {
-                        'x': list(self.data_buffers['gaze_x'])[-20:],
-                        'y': list(self.data_buffers['gaze_y'])[-20:]
-                    }
-            
-            elif data_type == 'eye':
-                # Extraire les données oculaires
-                if 'eye_data' in data and data['eye_data']:
-                    eye_data = data['eye_data']
-                    update_data['eye'] = {
-                        'left_pupil': float(eye_data.get('LPUPILD', 0)),
-                        'right_pupil': float(eye_data.get('RPUPILD', 0)),
-                        'left_open': float(eye_data.get('LEYEOPENESS', 0)) > 0.5,
-                        'right_open': float(eye_data.get('REYEOPENESS', 0)) > 0.5,
-                        'left_gaze_x': float(eye_data.get('LEYEGAZEX', 0.5)),
-                        'left_gaze_y': float(eye_data.get('LEYEGAZEY', 0.5)),
-                        'right_gaze_x': float(eye_data.get('REYEGAZEX', 0.5)),
-                        'right_gaze_y': float(eye_data.get('REYEGAZEY', 0.5))
-                    }
-                    update_data['pupil_history'] = {
-                        'left': list(self.data_buffers['pupil_left'])[-20:],
-                        'right': list(self.data_buffers['pupil_right'])[-20:]
-                    }
-            
-            elif data_type == 'fixation':
-                # Extraire les données de fixation
-                if 'fixation_data' in data and data['fixation_data']:
-                    fix_data = data['fixation_data']
-                    update_data['fixation'] = {
-                        'duration': float(fix_data.get('FPOGD', 0)),
-                        'x': float(fix_data.get('FPOGX', 0)),
-                        'y': float(fix_data.get('FPOGY', 0))
-                    }
-                    update_data['fixation_history'] = list(self.data_buffers['fixation_duration'])[-20:]
-            
-            # Émettre vers le module home
-            self.websocket_manager.emit_to_module('home', 'gazepoint_data_update', update_data)
         
-        except Exception as e:
-            logger.error(f"Erreur émission mise à jour Gazepoint: {e}")
+        elif data_type == 'eye':
+            update_data['eye'] = parsed
+            update_data['pupil_history'] = {
+                'left': self._tail('pupil_left'),
+                'right': self._tail('pupil_right')
+            }
+        
+        elif data_type == 'fixation':
+            update_data['fixation'] = parsed
+            update_data['fixation_history'] = self._tail('fixation_duration')
+        
+        return update_data
     
     def emit_dashboard_state(self):
         """Émet l'état complet du dashboard"""
@@ -871,12 +1141,12 @@ class DashboardHomeModule:
                 'session': {
                     'is_collecting': self.collection_state['is_collecting'],
                     'duration': self._get_session_duration(),
-                    'total_samples': self.session_stats['total_samples'],
+                    'total_samples': self._get_total_samples(),
                     'total_recordings': self.session_stats['total_recordings'],  # AJOUT
                     'total_recording_duration': self.session_stats['total_recording_duration'],  # AJOUT
                     'total_recording_size': self.session_stats['total_recording_size']  # AJOUT
                 },
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
             
             self.websocket_manager.emit_to_module('home', 'dashboard_state', state)
@@ -939,6 +1209,20 @@ class DashboardHomeModule:
         
         self.session_stats['devices_active'] = count
     
+    def _count_sample(self):
+        """Compter un échantillon reçu"""
+        with self._sample_lock:
+            self._total_samples += 1
+    
+    def _get_total_samples(self) -> int:
+        """Nombre d'échantillons reçus depuis le début de la collecte"""
+        return self._total_samples
+    
+    def _reset_total_samples(self):
+        """Remettre le compteur d'échantillons à zéro"""
+        with self._sample_lock:
+            self._total_samples = 0
+    
     def _get_session_duration(self) -> float:
         """Calcule la durée de la session en secondes"""
         if self.collection_state['is_collecting'] and self.collection_state['start_time']:
@@ -956,27 +1240,28 @@ class DashboardHomeModule:
             
             # Démarrer l'enregistrement CSV sur tous les modules
             results = {}
+            modules = self.modules
             
             # Module Polar
-            if self.polar_module:
-                csv_files = self.polar_module.start_csv_recording()
+            if modules.polar:
+                csv_files = modules.polar.start_csv_recording()
                 results['polar'] = {'success': bool(csv_files), 'files': csv_files}
             
             # Module Neurosity
-            if self.neurosity_module and self.neurosity_module.is_connected:
-                result = self.neurosity_module.start_recording()
+            if modules.neurosity and modules.neurosity.is_connected:
+                result = modules.neurosity.start_recording()
                 results['neurosity'] = result
             
             # Module Thermal
-            if self.thermal_module and self.thermal_module.is_running:
-                result = self.thermal_module.start_recording()
+            if modules.thermal and modules.thermal.is_running:
+                result = modules.thermal.start_recording()
                 results['thermal'] = {'success': result}
             
             # Module Gazepoint
-            if self.gazepoint_module and hasattr(self.gazepoint_module,
-                                                 'is_connected') and self.gazepoint_module.is_connected:
-                if hasattr(self.gazepoint_module, 'start_recording'):
-                    result = self.gazepoint_module.start_recording()
+            if modules.gazepoint and hasattr(modules.gazepoint,
+                                             'is_connected') and modules.gazepoint.is_connected:
+                if hasattr(modules.gazepoint, 'start_recording'):
+                    result = modules.gazepoint.start_recording()
                     results['gazepoint'] = {'success': result}
             
             # Note: Thought Capture n'a pas d'enregistrement CSV automatique,
@@ -989,13 +1274,13 @@ class DashboardHomeModule:
             
             # Réinitialiser les stats
             self.session_stats['start_time'] = self.collection_state['start_time']
-            self.session_stats['total_samples'] = 0
+            self._reset_total_samples()
             
             # Notifier le frontend
             self.websocket_manager.emit_to_module('home', 'collection_started', {
                 'session_id': self.collection_state['session_id'],
                 'results': results,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             })
             
             logger.info(f"Collecte globale démarrée: {self.collection_state['session_id']}")
@@ -1014,27 +1299,28 @@ class DashboardHomeModule:
             
             # Arrêter l'enregistrement sur tous les modules
             results = {}
+            modules = self.modules
             
             # Module Polar
-            if self.polar_module:
-                stats = self.polar_module.stop_csv_recording()
+            if modules.polar:
+                stats = modules.polar.stop_csv_recording()
                 results['polar'] = stats
             
             # Module Neurosity
-            if self.neurosity_module and self.neurosity_module.is_recording:
-                result = self.neurosity_module.stop_recording()
+            if modules.neurosity and modules.neurosity.is_recording:
+                result = modules.neurosity.stop_recording()
                 results['neurosity'] = result
             
             # Module Thermal
-            if self.thermal_module and self.thermal_module.is_recording:
-                result = self.thermal_module.stop_recording()
+            if modules.thermal and modules.thermal.is_recording:
+                result = modules.thermal.stop_recording()
                 results['thermal'] = {'success': result}
             
             # Module Gazepoint
-            if self.gazepoint_module and hasattr(self.gazepoint_module,
-                                                 'is_recording') and self.gazepoint_module.is_recording:
-                if hasattr(self.gazepoint_module, 'stop_recording'):
-                    result = self.gazepoint_module.stop_recording()
+            if modules.gazepoint and hasattr(modules.gazepoint,
+                                             'is_recording') and modules.gazepoint.is_recording:
+                if hasattr(modules.gazepoint, 'stop_recording'):
+                    result = modules.gazepoint.stop_recording()
                     results['gazepoint'] = {'success': result}
             
             # Calculer la durée totale
@@ -1049,8 +1335,8 @@ class DashboardHomeModule:
                 'session_id': session_id,
                 'duration': duration,
                 'results': results,
-                'total_samples': self.session_stats['total_samples'],
-                'timestamp': datetime.now().isoformat()
+                'total_samples': self._get_total_samples(),
+                'timestamp': now_iso()
             })
             
             # Réinitialiser
@@ -1071,14 +1357,14 @@ class DashboardHomeModule:
             'session': {
                 'is_collecting': self.collection_state['is_collecting'],
                 'duration': self._get_session_duration(),
-                'total_samples': self.session_stats['total_samples'],
+                'total_samples': self._get_total_samples(),
                 'devices_active': self.session_stats['devices_active'],
                 'total_recordings': self.session_stats['total_recordings'],  # AJOUT
                 'total_recording_duration': self.session_stats['total_recording_duration'],  # AJOUT
                 'total_recording_size': self.session_stats['total_recording_size']  # AJOUT
             },
             'latest_data': {},
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         }
         
         # Ajouter les dernières données si disponibles
@@ -1104,11 +1390,8 @@ class DashboardHomeModule:
         """Nettoie les ressources du module"""
         logger.info("Nettoyage du module Dashboard Home...")
         
-        self._running = False
-        
-        # Attendre la fin du thread
-        if self._update_thread and self._update_thread.is_alive():
-            self._update_thread.join(timeout=2)
+        # Arrêter le thread de mise à jour
+        self.stop()
         
         # Arrêter la collecte si active
         if self.collection_state['is_collecting']:
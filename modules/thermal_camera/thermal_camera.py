@@ -10,7 +10,6 @@ import mediapipe as mp
 import numpy as np
 import csv
 import json
-import base64
 import threading
 import time
 import os
@@ -18,6 +17,12 @@ from datetime import datetime
 from pathlib import Path
 import logging
 
+# Encodage base64 SIMD (pybase64) si installé, sinon module standard
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 logger = logging.getLogger(__name__)
 
 
@@ -265,6 +265,20 @@ class HomeModule {
             this.handleThoughtCaptureDataUpdate(data);
         });
 
+        // Mises à jour regroupées par le serveur: [[événement, données], ...] par passage
+        const tickHandlers = {
+            polar_data_update: (data) => this.handlePolarDataUpdate(data),
+            neurosity_data_update: (data) => this.handleNeurosityDataUpdate(data),
+            thermal_data_update: (data) => this.handleThermalDataUpdate(data),
+            gazepoint_data_update: (data) => this.handleGazepointDataUpdate(data)
+        };
+
+        this.wsClient.on('dashboard_tick', (tick) => {
+            for (const [event, data] of tick.updates || []) {
+                tickHandlers[event]?.(data);
+            }
+        });
+
         // Connexion/Déconnexion d'appareils
         this.wsClient.on('device_connected', (data) => {
             this.handleDeviceConnected(data);
@@ -2219,7 +2233,7 @@ class HomeModule {
     updateCharts(graphData) {
         // Mettre à jour le graphique BPM
         if (this.charts.bpm && graphData.bpm && graphData.bpm.length > 0) {
-            const bpmData = graphData.bpm.map(d => d.value);
+            const bpmData = graphData.bpm;
             const labels = graphData.bpm.map((_, i) => i);
 
             this.charts.bpm.data.labels = labels;
@@ -2229,7 +2243,7 @@ class HomeModule {
 
         // Mettre à jour le graphique RR
         if (this.charts.rr && graphData.rr && graphData.rr.length > 0) {
-            const rrData = graphData.rr.map(d => d.value);
+            const rrData = graphData.rr;
             const labels = graphData.rr.map((_, i) => i);
 
             this.charts.rr.data.labels = labels;
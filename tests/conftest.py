@@ -0,0 +1,7 @@
+"""
+Configuration pytest: modules de l'application importables depuis la racine du dépôt
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,41 @@
+"""
+Tests du fournisseur JSON orjson de l'application Flask
+"""
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('flask')
+pytest.importorskip('flask_socketio')
+pytest.importorskip('psutil')
+
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from app import OrjsonProvider
+
+
+@pytest.fixture
+def flask_app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_jsonify_numpy_scalar(flask_app):
+    with flask_app.app_context():
+        response = jsonify({'amplitude': np.round(np.std([1.0, 2.0, 4.0]), 3), 'count': np.int64(3)})
+    
+    assert response.status_code == 200
+    assert response.get_json() == {'amplitude': 1.247, 'count': 3}
+
+
+def test_jsonify_datetime_keeps_flask_format(flask_app):
+    stamp = datetime(2025, 1, 2, 3, 4, 5)
+    with flask_app.app_context():
+        response = jsonify({'timestamp': stamp})
+        expected = DefaultJSONProvider.default(stamp)
+    
+    assert response.get_json() == {'timestamp': expected}
+    assert expected == 'Thu, 02 Jan 2025 03:04:05 GMT'
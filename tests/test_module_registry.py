@@ -0,0 +1,83 @@
+"""
+Tests du registre des modules
+"""
+import io
+from datetime import datetime
+
+import orjson
+
+from module_registry import ModuleRegistry
+
+
+def test_export_modules_json_round_trip():
+    registry = ModuleRegistry()
+    registry.activate_module('polar')
+    
+    buffer = io.BytesIO()
+    registry.export_modules_json(buffer)
+    exported = orjson.loads(buffer.getvalue())
+    config = registry.export_modules_config()
+    
+    assert exported['version'] == config['version'] == '1.0.0'
+    assert exported['modules'] == config['modules']
+    assert set(exported['modules']) == set(registry.modules)
+    
+    # Horodatages écrits en ISO 8601, relisibles tels quels
+    polar = exported['modules']['polar']
+    assert datetime.fromisoformat(polar['created_at']) == registry.modules['polar']['created_at']
+    assert datetime.fromisoformat(polar['activated_at']) == registry.modules['polar']['activated_at']
+    datetime.fromisoformat(exported['exported_at'])
+
+
+def _assert_indexes_match(registry):
+    """Index et compteurs incrémentaux identiques à un recomptage de registry.modules"""
+    modules = registry.modules
+    categories = {config.get('category', 'unknown') for config in modules.values()}
+    for category in categories | {'biometric', 'eye_tracking', 'missing'}:
+        expected = {module_id for module_id, config in modules.items()
+                    if config.get('category') == category}
+        assert set(registry.get_modules_by_category(category)) == expected
+    
+    enabled = {module_id for module_id, config in modules.items() if config.get('enabled', False)}
+    assert set(registry.get_enabled_modules()) == enabled
+    
+    summary = registry.get_modules_summary()
+    assert summary['total_modules'] == len(modules)
+    assert summary['enabled_modules'] == len(enabled)
+    assert summary['disabled_modules'] == len(modules) - len(enabled)
+    
+    expected_categories = {}
+    expected_statuses = {}
+    for config in modules.values():
+        category = config.get('category', 'unknown')
+        status = config.get('status', 'unknown')
+        expected_categories[category] = expected_categories.get(category, 0) + 1
+        expected_statuses[status] = expected_statuses.get(status, 0) + 1
+    assert summary['categories'] == expected_categories
+    assert summary['statuses'] == expected_statuses
+
+
+def test_incremental_indexes_follow_mutations():
+    registry = ModuleRegistry()
+    _assert_indexes_match(registry)
+    
+    config = {'name': 'Test', 'description': 'Module de test', 'icon': 'fa-vial',
+              'category': 'biometric', 'enabled': True}
+    assert registry.register_module('test_module', dict(config))
+    _assert_indexes_match(registry)
+    
+    # Ré-enregistrement avec une autre catégorie et désactivé
+    assert registry.register_module('test_module', {**config, 'category': 'eye_tracking', 'enabled': False})
+    _assert_indexes_match(registry)
+    
+    assert registry.enable_module('test_module')
+    assert registry.activate_module('test_module')
+    _assert_indexes_match(registry)
+    
+    assert registry.disable_module('test_module')
+    assert registry.deactivate_module('test_module')
+    _assert_indexes_match(registry)
+    
+    assert registry.unregister_module('test_module')
+    assert 'test_module' not in registry.modules
+    _assert_indexes_match(registry)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Horodatages - BioMedical Hub
+Horodatage ISO partagé par l'application et les modules
+"""
+
+from datetime import datetime
+import time
+
+
+# Durée de réutilisation d'une chaîne ISO (ns): les rafales d'échantillons et les
+# champs 'timestamp' d'une même requête partagent la même chaîne, sans que deux
+# événements distants de plus d'une milliseconde ne reçoivent le même horodatage
+ISO_TTL_NS = 1_000_000
+
+# (instant monotone du calcul en ns, chaîne ISO)
+_iso_cache = (-ISO_TTL_NS, '')
+
+
+def now_iso():
+    """Horodatage ISO courant, recalculé au plus toutes les ISO_TTL_NS (1 ms)"""
+    global _iso_cache
+    stamp, iso = _iso_cache
+    now = time.monotonic_ns()
+    if now - stamp >= ISO_TTL_NS:
+        iso = datetime.now().isoformat()
+        _iso_cache = (now, iso)
+    return iso
@@ -8,14 +8,33 @@ Version corrigée avec broadcast amélioré
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from datetime import datetime
 import logging
-import json
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+class OrjsonSerializer:
+    """Module JSON (dumps/loads) basé sur orjson pour l'encodage des paquets Socket.IO"""
+    
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # kwargs (separators, ...) ignorés: orjson produit toujours un JSON compact
+        return orjson.dumps(obj, option=OrjsonSerializer.OPTIONS).decode('utf-8')
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 class WebSocketManager:
     """Gestionnaire centralisé des WebSockets pour tous les modules"""
     
+    # Room des clients suivant l'activation/désactivation des modules
+    MODULE_STATUS_ROOM = 'module_status'
+    
     def __init__(self, app=None):
         self.app = app
         self.socketio = None
@@ -23,17 +42,26 @@ class WebSocketManager:
         self.active_modules = {}
         self.event_handlers = {}
         self.broadcast_subscriptions = {}  # NEW: Track broadcast subscriptions
+        self._clients_version = 0  # Incrémenté à chaque changement de clients/abonnements
+        self._clients_summary = None  # (version, liste résumée des clients)
+        self._disconnect_callbacks = []  # Appelés avec l'ID du client déconnecté
         
         if app is not None:
             self.init_app(app)
     
-    def init_app(self, app):
-        """Initialiser le gestionnaire avec l'application Flask"""
+    def init_app(self, app, async_mode='threading'):
+        """Initialiser le gestionnaire avec l'application Flask
+
+        Args:
+            app: Application Flask
+            async_mode (str): 'threading' (serveur Werkzeug), 'eventlet' ou 'gevent'
+        """
         self.app = app
         self.socketio = SocketIO(
             app,
             cors_allowed_origins="*",
-            async_mode='threading',
+            async_mode=async_mode,
+            json=OrjsonSerializer,
             logger=True,
             engineio_logger=True
         )
@@ -48,16 +76,21 @@ class WebSocketManager:
         @self.socketio.on('connect')
         def handle_connect(auth):
             client_id = self._get_client_id()
+            ip = self._get_client_ip() or 'Unknown'
             client_info = {
                 'connected_at': datetime.now().isoformat(),
                 'current_module': None,
                 'subscriptions': [],
                 'broadcast_subscriptions': [],  # NEW
-                'ip': self._get_client_ip(),
-                'user_agent': self._get_user_agent()
+                'ip': ip,
+                'user_agent': self._get_user_agent(),
+                # Formes tronquées exposées par l'API, calculées une seule fois
+                'client_id_short': f"{client_id[:8]}...",
+                'ip_short': f"{ip[:10]}..."
             }
             
             self.connected_clients[client_id] = client_info
+            self._clients_version += 1
             logger.info(f"Client connecté: {client_id}")
             
             # Émettre le statut de connexion
@@ -132,6 +165,17 @@ class WebSocketManager:
                 'modules': modules,
                 'timestamp': datetime.now().isoformat()
             })
+        
+        @self.socketio.on('subscribe_module_status')
+        def handle_module_status_subscription(data=None):
+            join_room(self.MODULE_STATUS_ROOM)
+            self.emit_to_current_client('module_status_subscription_confirmed', {
+                'timestamp': datetime.now().isoformat()
+            })
+        
+        @self.socketio.on('unsubscribe_module_status')
+        def handle_module_status_unsubscription(data=None):
+            leave_room(self.MODULE_STATUS_ROOM)
     
     def register_module_events(self, module_name, event_handlers):
         """Enregistrer les événements spécifiques à un module
@@ -151,6 +195,15 @@ class WebSocketManager:
             self.socketio.on(full_event_name)(handler)
             logger.info(f"Événement enregistré: {full_event_name}")
     
+    def register_modules_bulk(self, modules_events):
+        """Enregistrer en une passe les événements de plusieurs modules
+
+        Args:
+            modules_events (dict): Dictionnaire {module_name: {event_name: handler_function}}
+        """
+        for module_name, event_handlers in modules_events.items():
+            self.register_module_events(module_name, event_handlers)
+    
     def emit_to_client(self, client_id, event, data):
         """Émettre un événement à un client spécifique"""
         self.socketio.emit(event, data, room=client_id)
@@ -197,6 +250,17 @@ class WebSocketManager:
         else:
             logger.info(f"Broadcast {event} -> tous les clients")
     
+    def emit_module_status(self, event, data):
+        """Émettre un changement de cycle de vie d'un module à la room 'module_status'
+
+        Seuls les clients abonnés via 'subscribe_module_status' le reçoivent.
+        L'envoi passe par une tâche de fond SocketIO: l'appelant (requête HTTP)
+        n'attend pas la diffusion.
+        """
+        self.socketio.start_background_task(
+            self.socketio.emit, event, data, to=self.MODULE_STATUS_ROOM
+        )
+    
     def emit_to_broadcast_subscribers(self, module_name, event, data):
         """Émettre uniquement aux clients abonnés au broadcast d'un module"""
         broadcast_room = f"broadcast_{module_name}"
@@ -205,11 +269,41 @@ class WebSocketManager:
     
     def get_module_clients(self, module_name):
         """Récupérer la liste des clients connectés à un module"""
-        clients = []
-        for client_id, info in self.connected_clients.items():
-            if module_name in info.get('subscriptions', []):
-                clients.append(client_id)
-        return clients
+        module = self.active_modules.get(module_name)
+        return list(module['clients']) if module else []
+    
+    def count_module_clients(self, module_name):
+        """Récupérer le nombre de clients connectés à un module, sans construire de liste"""
+        module = self.active_modules.get(module_name)
+        return len(module['clients']) if module else 0
+    
+    def has_subscribers(self, module_name):
+        """Vérifier qu'au moins un client suit un module (active_modules ne garde que ceux-là)"""
+        return module_name in self.active_modules
+    
+    @property
+    def clients_version(self):
+        """Version courante de la liste des clients (pour ETag/caches)"""
+        return self._clients_version
+    
+    def get_clients_summary(self):
+        """Récupérer la liste résumée des clients, reconstruite seulement après un changement"""
+        cached = self._clients_summary
+        if cached is not None and cached[0] == self._clients_version:
+            return cached[1]
+        
+        version = self._clients_version
+        summary = [
+            {
+                'client_id': info['client_id_short'],
+                'connected_at': info['connected_at'],
+                'subscriptions': list(info['subscriptions']),
+                'ip': info['ip_short']
+            }
+            for info in list(self.connected_clients.values())
+        ]
+        self._clients_summary = (version, summary)
+        return summary
     
     def get_broadcast_subscribers(self, module_name):
         """Récupérer la liste des clients abonnés au broadcast d'un module"""
@@ -225,10 +319,12 @@ class WebSocketManager:
     
     def get_active_modules_count(self):
         """Récupérer le nombre de modules actifs"""
-        active_modules = set()
-        for client_info in self.connected_clients.values():
-            active_modules.update(client_info.get('subscriptions', []))
-        return len(active_modules)
+        # active_modules ne contient que les modules ayant au moins un abonné
+        return len(self.active_modules)
+    
+    def get_status_snapshot(self):
+        """Récupérer (clients connectés, modules actifs) en une seule lecture"""
+        return len(self.connected_clients), len(self.active_modules)
     
     def _subscribe_client_to_module(self, client_id, module_name):
         """Abonner un client à un module"""
@@ -243,6 +339,7 @@ class WebSocketManager:
         if module_name not in client_subscriptions:
             client_subscriptions.append(module_name)
             self.connected_clients[client_id]['subscriptions'] = client_subscriptions
+            self._clients_version += 1
         
         # Ajouter le client au module actif
         if module_name not in self.active_modules:
@@ -270,6 +367,7 @@ class WebSocketManager:
         if module_name in client_subscriptions:
             client_subscriptions.remove(module_name)
             self.connected_clients[client_id]['subscriptions'] = client_subscriptions
+            self._clients_version += 1
         
         # Retirer le client du module actif
         if module_name in self.active_modules:
@@ -289,7 +387,8 @@ class WebSocketManager:
             return
         
         # Désabonner de tous les modules
-        subscriptions = self.connected_clients[client_id].get('subscriptions', [])
+        # Copie: le désabonnement retire les modules de cette même liste
+        subscriptions = list(self.connected_clients[client_id].get('subscriptions', []))
         for module_name in subscriptions:
             self._unsubscribe_client_from_module(client_id, module_name)
         
@@ -303,6 +402,19 @@ class WebSocketManager:
         
         # Supprimer le client
         del self.connected_clients[client_id]
+        self._clients_version += 1
+        
+        # État par client tenu hors du gestionnaire (ex: dernier statut envoyé)
+        for callback in self._disconnect_callbacks:
+            try:
+                callback(client_id)
+            except Exception as e:
+                logger.error(f"Erreur callback de déconnexion pour {client_id}: {e}")
+    
+    def on_client_disconnect(self, callback):
+        """Enregistrer une fonction appelée avec l'ID de chaque client déconnecté"""
+        self._disconnect_callbacks.append(callback)
+        return callback
     
     def _get_client_id(self):
         """Récupérer l'ID du client actuel"""
@@ -321,10 +433,11 @@ class WebSocketManager:
     
     def _get_server_info(self):
         """Récupérer les informations du serveur"""
+        connected_clients, active_modules = self.get_status_snapshot()
         return {
             'timestamp': datetime.now().isoformat(),
-            'connected_clients': len(self.connected_clients),
-            'active_modules': self.get_active_modules_count(),
+            'connected_clients': connected_clients,
+            'active_modules': active_modules,
             'broadcast_subscriptions': {
                 module: len(subscribers)
                 for module, subscribers in self.broadcast_subscriptions.items()